@@ -9,6 +9,9 @@ import yaml
 import logging
 from typing import Dict, Any, Optional
 
+# libyaml-basierter (C-)Loader, falls PyYAML damit gebaut wurde
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 class ConfigLoader:
     """
     Zentrale Klasse zum Laden und Verwalten von Konfigurationen aus verschiedenen Quellen.
@@ -59,8 +62,9 @@ class ConfigLoader:
         config_path = os.path.join(os.path.dirname(__file__), filename)
         try:
             if os.path.exists(config_path):
-                with open(config_path, 'r') as f:
-                    return yaml.safe_load(f) or {}
+                # Binär lesen: libyaml dekodiert UTF-8 selbst
+                with open(config_path, 'rb') as f:
+                    return yaml.load(f.read(), Loader=_YAML_LOADER) or {}
             else:
                 logging.getLogger("mindestentinel.config").warning(
                     f"Konfigurationsdatei nicht gefunden: {config_path}. Verwende leere Konfiguration."
@@ -106,8 +110,8 @@ class ConfigLoader:
         rules_path = os.path.join(os.path.dirname(__file__), 'rules.yaml')
         try:
             if os.path.exists(rules_path):
-                with open(rules_path, 'r') as f:
-                    rules = yaml.safe_load(f)
+                with open(rules_path, 'rb') as f:
+                    rules = yaml.load(f.read(), Loader=_YAML_LOADER)
                     logging.getLogger("mindestentinel.config").info(
                         f"Geladene Regeln: {len(rules.get('rules', []))} Regeln gefunden"
                     )
@@ -1,4 +1,4 @@
-# protection_module 
+# protection_module
 # src/core/protection_module.py
 """
 ProtectionModule - Validiert Eingaben und Systemaktionen gegen RuleEngine.
@@ -6,48 +6,147 @@ ProtectionModule - Validiert Eingaben und Systemaktionen gegen RuleEngine.
 """
 
 from __future__ import annotations
-from typing import Any
+import functools
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from src.core.rule_engine import RuleEngine
 
+# Prüfmethoden, die eine RuleEngine anbieten kann (in Auflösungsreihenfolge)
+_CHECK_METHODS = (
+    "is_action_allowed", "evaluate", "match_rules", "allows", "allow",
+    "check", "is_allowed", "apply_rules",
+)
+
+# Sammel-Prüfmethoden, die eine RuleEngine optional anbieten kann
+_BATCH_CHECK_METHODS = ("is_actions_allowed", "evaluate_batch")
+
+# Prüffunktionen je RuleEngine-Klasse: (check, check_all), jeweils mit rule_engine als erstem Argument
+_CHECKER_CACHE: Dict[type, Tuple[Callable[..., bool], Callable[..., List[bool]]]] = {}
+
+
+def _allowed(result: Any) -> bool:
+    # bool-Ergebnisse direkt durchreichen; Mappings (z. B. von apply_rules) über "allowed" auswerten
+    if result is True or result is False:
+        return result
+    get = getattr(result, "get", None)
+    if get is not None:
+        return bool(get("allowed", False))
+    return bool(result)
+
+
+def _build_checkers(cls: type) -> Tuple[Callable[..., bool], Callable[..., List[bool]]]:
+    """
+    Sucht die Prüfmethoden einmal auf der RuleEngine-Klasse und liefert Einzel- und
+    Sammel-Prüffunktion. Ohne Bulk-API wird die Einzelprüfung in einer Schleife genutzt.
+    """
+    for name in _CHECK_METHODS:
+        method = getattr(cls, name, None)
+        if callable(method):
+            break
+    else:
+        raise TypeError("rule_engine bietet keine bekannte Prüfmethode")
+
+    def check(rule_engine: Any, subject: str, context: Optional[Dict[str, Any]] = None) -> bool:
+        return _allowed(method(rule_engine, subject, context))
+
+    for name in _BATCH_CHECK_METHODS:
+        batch_method = getattr(cls, name, None)
+        if callable(batch_method):
+            def check_all(rule_engine: Any, subjects: List[str], context: Optional[Dict[str, Any]] = None) -> List[bool]:
+                return [_allowed(r) for r in batch_method(rule_engine, subjects, context)]
+            return check, check_all
+
+    return check, _loop_checker(check)
+
+
+def _loop_checker(check: Callable[..., bool]) -> Callable[..., List[bool]]:
+    # Sammel-Prüfung über die Einzelprüfung, falls die RuleEngine keine Bulk-API hat
+    def check_all(rule_engine: Any, subjects: List[str], context: Optional[Dict[str, Any]] = None) -> List[bool]:
+        return [check(rule_engine, subject, context) for subject in subjects]
+    return check_all
+
+
+def _register_checker(cls: type, check_all: Optional[Callable[..., List[bool]]] = None) -> Callable:
+    """
+    Registriert eine spezialisierte Prüffunktion für eine bekannte RuleEngine-Klasse;
+    für diese Klasse entfällt die Suche nach Prüfmethoden. Ohne check_all wird die
+    Sammel-Prüfung über die Einzelprüfung gebildet.
+    """
+    def decorator(check: Callable[..., bool]) -> Callable[..., bool]:
+        _CHECKER_CACHE[cls] = (check, check_all or _loop_checker(check))
+        return check
+    return decorator
+
+
+def _check_all_rule_engine(rule_engine: RuleEngine, subjects: List[str], context: Optional[Dict[str, Any]] = None) -> List[bool]:
+    return rule_engine.apply_rules_batch(subjects, context).tolist()
+
+
+@_register_checker(RuleEngine, _check_all_rule_engine)
+def _check_rule_engine(rule_engine: RuleEngine, subject: str, context: Optional[Dict[str, Any]] = None) -> bool:
+    return bool(rule_engine.apply_rules(subject, context).get("allowed", False))
+
+
 class ProtectionModule:
+    # Feste Attributmenge ohne __dict__; Unterklassen mit eigenen Attributen
+    # müssen eigene __slots__ (oder "__dict__") deklarieren
+    __slots__ = ("rule_engine", "_check", "_check_all")
+
     def __init__(self, rule_engine: RuleEngine = None):
-    # Flexible initialization: accept a RuleEngine instance, a path, a class, or None.
-    # If None, attempt to create a default RuleEngine.
-    if rule_engine is None:
-        try:
-            rule_engine = RuleEngine()
-        except Exception:
-            rule_engine = None
-    else:
-        # If a string path is provided, try to instantiate RuleEngine with it
-        if isinstance(rule_engine, str):
-            try:
-                rule_engine = RuleEngine(rules_path=rule_engine)
-            except Exception:
-                pass
-        # If a class is provided, try to instantiate it
-        elif isinstance(rule_engine, type):
+        # Flexible initialization: accept a RuleEngine instance, a path, a class, or None.
+        # If None, attempt to create a default RuleEngine.
+        if rule_engine is None:
             try:
-                rule_engine = rule_engine()
+                rule_engine = RuleEngine()
             except Exception:
-                pass
-    if not isinstance(rule_engine, RuleEngine):
-        raise TypeError("rule_engine muss RuleEngine-Instanz sein")
-    self.rule_engine = rule_engine
-
+                rule_engine = None
+        else:
+            # If a string path is provided, try to instantiate RuleEngine with it
+            if isinstance(rule_engine, str):
+                try:
+                    rule_engine = RuleEngine(rules_path=rule_engine)
+                except Exception:
+                    pass
+            # If a class is provided, try to instantiate it
+            elif isinstance(rule_engine, type):
+                try:
+                    rule_engine = rule_engine()
+                except Exception:
+                    pass
         if not isinstance(rule_engine, RuleEngine):
             raise TypeError("rule_engine muss RuleEngine-Instanz sein")
         self.rule_engine = rule_engine
+        # Prüfmethoden einmal pro RuleEngine-Klasse auflösen statt bei jedem Aufruf zu suchen
+        engine_cls = type(rule_engine)
+        checkers = _CHECKER_CACHE.get(engine_cls)
+        if checkers is None:
+            checkers = _CHECKER_CACHE.setdefault(engine_cls, _build_checkers(engine_cls))
+        self._check = functools.partial(checkers[0], rule_engine)
+        self._check_all = functools.partial(checkers[1], rule_engine)
+
+    def _is_allowed(self, subject: str, context: Optional[Dict[str, Any]] = None) -> bool:
+        return self._check(subject, context)
 
-    def validate_user_input(self, user_input: str) -> bool:
-        if not isinstance(user_input, str):
+    def validate_user_input(self, user_input: str, context: Optional[Dict[str, Any]] = None) -> bool:
+        # type() is str als schneller Pfad; str-Unterklassen bleiben über isinstance erlaubt
+        if type(user_input) is not str and not isinstance(user_input, str):
             raise TypeError("user_input muss string sein")
-        if not self.rule_engine.is_action_allowed(user_input):
+        if not self._check(user_input, context):
             raise PermissionError("Eingabe verletzt die Regeln und wurde verworfen.")
         return True
 
-    def validate_system_action(self, action_desc: str) -> bool:
-        if not self.rule_engine.is_action_allowed(action_desc):
+    def validate_user_inputs(self, inputs: Iterable[str], context: Optional[Dict[str, Any]] = None) -> List[bool]:
+        """
+        Prüft mehrere Eingaben auf einmal und liefert eine Maske (True = erlaubt),
+        ohne bei Verstößen PermissionError zu heben.
+        """
+        inputs = list(inputs)
+        for user_input in inputs:
+            if type(user_input) is not str and not isinstance(user_input, str):
+                raise TypeError("user_input muss string sein")
+        return self._check_all(inputs, context)
+
+    def validate_system_action(self, action_desc: str, context: Optional[Dict[str, Any]] = None) -> bool:
+        if not self._check(action_desc, context):
             raise PermissionError("Systemaktion verletzt Regeln.")
         return True
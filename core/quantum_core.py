@@ -10,6 +10,7 @@ QuantumCore - höherstufige Fassade für Quanten-Operationen.
 from __future__ import annotations
 from typing import Any, Dict, Optional
 import logging
+import types
 
 _LOGGER = logging.getLogger("mindestentinel.quantum_core")
 _LOGGER.addHandler(logging.NullHandler())
@@ -29,6 +30,9 @@ except Exception:
     NeuralQuantumNet = None
     _HAS_NQ = False
 
+# Verfügbarkeit der Provider, einmal beim Import festgehalten
+_CAPABILITIES = types.MappingProxyType({"has_qcomp": _HAS_QCOMP, "has_neural_quantum": _HAS_NQ})
+
 class QuantumCore:
     def __init__(self, provider: str = "qiskit"):
         self.provider = provider
@@ -43,6 +47,13 @@ class QuantumCore:
                 self._qc = QuantumComputing(provider=provider)
             except Exception as e:
                 _LOGGER.warning("QuantumComputing konnte nicht initialisiert werden: %s", e)
+        # NeuralQuantumNet einmal pro Instanz (für pennylane sofort, sonst beim ersten Aufruf)
+        self._nq = None
+        if provider == "pennylane" and _HAS_NQ:
+            try:
+                self._nq = NeuralQuantumNet(wires=2)
+            except Exception as e:
+                _LOGGER.warning("NeuralQuantumNet konnte nicht initialisiert werden: %s", e)
 
     def run_bell_pair(self) -> Dict[str, int]:
         """Erstellt ein Bell-Pair mit Qiskit (falls verfügbar) und liefert Counts."""
@@ -54,14 +65,13 @@ class QuantumCore:
         """Kleinere helper via PennyLane / neural quantum."""
         if not _HAS_NQ:
             raise RuntimeError("PennyLane-basierte Netze nicht verfügbar.")
-        # instantiate a small NeuralQuantumNet and run forward
-        nq = NeuralQuantumNet(wires=2)
-        out = nq.forward()
+        if self._nq is None:
+            self._nq = NeuralQuantumNet(wires=2)
+        out = self._nq.forward()
         # convert output to float (sum of expectations)
-        try:
-            return float(sum(out))
-        except Exception:
+        if out is None:
             return 0.0
+        return float(sum(out))
 
     def provider_info(self) -> Dict[str, Any]:
-        return {"provider": self.provider, "has_qcomp": _HAS_QCOMP, "has_neural_quantum": _HAS_NQ}
+        return {"provider": self.provider, **_CAPABILITIES}
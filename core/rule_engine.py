@@ -17,6 +17,19 @@ import re
 
 DEFAULT_RULES_PATH = Path("config") / "rules.yaml"
 
+# libyaml-basierte (C-)Loader/Dumper verwenden, falls PyYAML damit gebaut wurde
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Explizit gesperrte Begriffe (Teilstrings, in Kleinschreibung)
+_BLACKLIST = (
+    "delete all", "format", "drop table", "shutdown -h now",
+    "rm -rf /", "self-destruct", "kill process", "unauthoriz", "exploit"
+)
+
+# Schlüsselwörter eines Gesetzes: Wörter mit mindestens 4 Zeichen
+_KEYWORD_RE = re.compile(r"\w{4,}")
+
 class RuleViolationError(PermissionError):
     """Raised when an action violates one or more rules."""
 
@@ -25,6 +38,10 @@ class RuleEngine:
         self.rules_path = Path(rules_path) if rules_path else DEFAULT_RULES_PATH
         self._laws: List[str] = []
         self._compiled_patterns: List[re.Pattern] = []
+        # Blacklist und alle Gesetzes-Muster als ein Muster: ein Suchlauf pro Aktion
+        self._combined_pattern: Optional[re.Pattern] = None
+        # Kürzester Text, den das kombinierte Muster treffen kann (kürzere Aktionen sind unauffällig)
+        self._min_match_len = 0
         self._load_rules()
 
     def _load_rules(self) -> None:
@@ -39,25 +56,32 @@ class RuleEngine:
             }
             self.rules_path.parent.mkdir(parents=True, exist_ok=True)
             with self.rules_path.open("w", encoding="utf-8") as fh:
-                yaml.safe_dump(default, fh, sort_keys=False, allow_unicode=True)
+                yaml.dump(default, fh, Dumper=_YAML_DUMPER, sort_keys=False, allow_unicode=True)
             self._laws = default["laws"]
         else:
-            with self.rules_path.open("r", encoding="utf-8") as fh:
-                data = yaml.safe_load(fh) or {}
-                self._laws = data.get("laws", [])
+            # Binär lesen: libyaml dekodiert UTF-8 selbst
+            data = yaml.load(self.rules_path.read_bytes(), Loader=_YAML_LOADER) or {}
+            self._laws = data.get("laws", [])
         # Prepare simple patterns (lowercase) for quick checks
         self._compiled_patterns = []
+        literal_lengths = [len(b) for b in _BLACKLIST]
         for law in self._laws:
             # create patterns of important keywords, fallback to whole-text check
             text = law.lower()
             # extract words longer than 3 chars as potential keywords
-            keywords = [w for w in re.findall(r"\w{4,}", text)]
+            keywords = _KEYWORD_RE.findall(text)
             if keywords:
                 # pattern: any of keywords appears
                 pat = re.compile(r"|".join(re.escape(k) for k in keywords))
+                literal_lengths.extend(map(len, keywords))
             else:
                 pat = re.compile(re.escape(text))
+                literal_lengths.append(len(text))
             self._compiled_patterns.append(pat)
+        self._min_match_len = min(literal_lengths)
+        self._combined_pattern = re.compile("|".join(
+            [re.escape(b) for b in _BLACKLIST] + [f"(?:{pat.pattern})" for pat in self._compiled_patterns]
+        ))
 
     def get_all_laws(self) -> List[str]:
         """Gibt eine Kopie der geladenen Gesetze zurück."""
@@ -76,21 +100,12 @@ class RuleEngine:
 
         low = action_text.lower()
 
-        # 1) Blacklist common dangerous terms (explicit)
-        blacklist = [
-            "delete all", "format", "drop table", "shutdown -h now",
-            "rm -rf /", "self-destruct", "kill process", "unauthoriz", "exploit"
-        ]
-        for b in blacklist:
-            if b in low:
-                return False
-
-        # 2) Pattern-based checks against laws
-        for pat in self._compiled_patterns:
-            if pat.search(low):
-                # If the law text refers to allowed actions, we need more logic.
-                # Conservative approach: treat any match as potential violation and require manual check.
-                return False
+        # 1) Blacklist common dangerous terms (explicit) and
+        # 2) pattern-based checks against laws, combined into a single search.
+        # If the law text refers to allowed actions, we need more logic.
+        # Conservative approach: treat any match as potential violation and require manual check.
+        if len(low) >= self._min_match_len and self._combined_pattern.search(low):
+            return False
 
         # 3) Context-based allow logic (simple)
         if context:
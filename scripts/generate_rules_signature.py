@@ -15,6 +15,9 @@ KEY_FILE = "config/rules_key.key"
 RULES_FILE = "config/rules.yaml"
 SIGNATURE_FILE = "config/rules.sig"
 
+# Blockgröße beim Einlesen der Regeldatei für die Signatur
+CHUNK_SIZE = 1 << 20
+
 # Logging konfigurieren
 logging.basicConfig(
     level=logging.INFO,
@@ -47,10 +50,12 @@ def load_key(key_path: str) -> bytes:
         return f.read()
 
 def generate_signature(rules_path: str, key: bytes) -> str:
-    """Generiert eine Signatur für die Regeldatei"""
+    """Generiert eine Signatur für die Regeldatei (blockweise, ohne die ganze Datei zu laden)"""
+    mac = hmac.new(key, digestmod=hashlib.sha256)
     with open(rules_path, 'rb') as f:
-        rules_data = f.read()
-    return hmac.new(key, rules_data, hashlib.sha256).hexdigest()
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            mac.update(chunk)
+    return mac.hexdigest()
 
 def save_signature(signature: str, sig_path: str) -> None:
     """Speichert die Signatur in einer Datei"""
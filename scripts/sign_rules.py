@@ -21,6 +21,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger("sign_rules")
 
+# Blockgröße beim Einlesen der Regeldatei für die Signatur
+CHUNK_SIZE = 1 << 20
+
 def sign(rules_path: Path, key_path: Path, sig_path: Path):
     """Signiert die Regeldatei"""
     try:
@@ -34,10 +37,12 @@ def sign(rules_path: Path, key_path: Path, sig_path: Path):
             logger.error(f"Regeldatei nicht gefunden: {rules_path}")
             return False
             
-        # Signiere die Regeldatei
-        data = rules_path.read_bytes()
-        mac = hmac.new(key, data, hashlib.sha256).hexdigest()
-        sig_path.write_text(mac)
+        # Signiere die Regeldatei (blockweise, ohne die ganze Datei zu laden)
+        mac = hmac.new(key, digestmod=hashlib.sha256)
+        with rules_path.open("rb") as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                mac.update(chunk)
+        sig_path.write_text(mac.hexdigest())
         
         logger.info(f"Regeldatei signiert: {rules_path}")
         logger.info(f"Signaturschlüssel gespeichert: {key_path}")
@@ -9,19 +9,15 @@ NeuralQuantumNet - PennyLane-basierter Hybrid-QNN-Baustein.
 from __future__ import annotations
 import logging
 
-_LOGGER = logging.getLogger("mindestentinel.neural_quantum")
+from src.core.quantum_computing import _pennylane, _pennylane_numpy
 
-try:
-    import pennylane as qml
-    from pennylane import numpy as np
-    _HAS_PENNYLANE = True
-except Exception:
-    _HAS_PENNYLANE = False
+_LOGGER = logging.getLogger("mindestentinel.neural_quantum")
 
 class NeuralQuantumNet:
     def __init__(self, wires: int = 2):
-        if not _HAS_PENNYLANE:
-            raise RuntimeError("PennyLane nicht installiert (pip install pennylane).")
+        # Import beim ersten Gebrauch; RuntimeError, falls PennyLane fehlt oder defekt ist
+        qml = _pennylane()
+        np = _pennylane_numpy()
         self.wires = wires
         self.dev = qml.device("default.qubit", wires=wires)
         # initial params
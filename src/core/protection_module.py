@@ -8,37 +8,72 @@ import os
 import sys
 import logging
 import time
-from typing import Dict, Any, Optional, List, Tuple, Union
+import collections
+import functools
+import importlib
+import importlib.util
+import itertools
+import random
+import threading
+import types
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, Tuple, Union
+
+if TYPE_CHECKING:
+    from core.rule_engine import RuleEngine
+
+def _subdirs(path: str) -> frozenset:
+    """
+    Liefert die Namen aller Unterverzeichnisse von path mit einem einzigen os.scandir
+    
+    Args:
+        path: Zu durchsuchendes Verzeichnis
+        
+    Returns:
+        frozenset: Namen der Unterverzeichnisse (leer, wenn path nicht lesbar ist)
+    """
+    try:
+        with os.scandir(path) as entries:
+            return frozenset(entry.name for entry in entries if entry.is_dir())
+    except OSError:
+        return frozenset()
 
 # Robuste Projekt-Root-Erkennung
+@functools.cache
 def get_project_root() -> str:
     """
     Findet das Projekt-Root-Verzeichnis unabhängig vom aktuellen Arbeitsverzeichnis
     
+    Das Ergebnis wird pro Prozess zwischengespeichert.
+    
     Returns:
         str: Absolute Pfad zum Projekt-Root
     """
     current_file = os.path.abspath(__file__)
     current_dir = os.path.dirname(current_file)
     
+    def has_src_core(root: str, names: frozenset) -> bool:
+        return "src" in names and "core" in _subdirs(os.path.join(root, "src"))
+    
     # Versuche 1: Von src/core aus
     project_root = os.path.dirname(os.path.dirname(current_dir))
-    if os.path.exists(os.path.join(project_root, "core")):
+    if "core" in _subdirs(project_root):
         return project_root
     
     # Versuche 2: Von core aus
     project_root = os.path.dirname(current_dir)
-    if os.path.exists(os.path.join(project_root, "src", "core")):
+    if has_src_core(project_root, _subdirs(project_root)):
         return project_root
     
     # Versuche 3: Aktuelles Verzeichnis ist Projekt-Root
     project_root = current_dir
-    if os.path.exists(os.path.join(project_root, "src", "core")) or os.path.exists(os.path.join(project_root, "core")):
+    names = _subdirs(project_root)
+    if "core" in names or has_src_core(project_root, names):
         return project_root
     
     # Versuche 4: Projekt-Root ist zwei Ebenen höher
     project_root = os.path.dirname(os.path.dirname(os.path.dirname(current_dir)))
-    if os.path.exists(os.path.join(project_root, "core")):
+    if "core" in _subdirs(project_root):
         return project_root
     
     # Fallback: Aktuelles Verzeichnis
@@ -49,84 +84,263 @@ PROJECT_ROOT = get_project_root()
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
-# Import-Handling für ConfigLoader
-config_loader = None
-try:
-    # Versuche 1: Import aus config
-    from config.config_loader import load_config
-    config_loader = load_config
-    logging.debug("ConfigLoader erfolgreich aus config.config_loader importiert")
-except ImportError as e1:
+def _find_spec(module_name: str):
+    """
+    Sucht ein Modul, ohne es zu importieren oder bei Fehlschlag eine Exception zu werfen
+    
+    Args:
+        module_name: Vollqualifizierter Modulname
+        
+    Returns:
+        ModuleSpec oder None, wenn das Modul nicht gefunden wurde
+    """
     try:
-        # Versuche 2: Import aus src/config
-        from src.config.config_loader import load_config
-        config_loader = load_config
-        logging.debug("ConfigLoader erfolgreich aus src.config.config_loader importiert")
-    except ImportError as e2:
+        return importlib.util.find_spec(module_name)
+    except (ImportError, ValueError):
+        return None
+
+def _resolve_config_loader() -> Optional[str]:
+    """
+    Sucht config_loader.py unter PROJECT_ROOT/config bzw. PROJECT_ROOT/src/config
+    
+    Jedes Kandidatenverzeichnis wird mit genau einem os.scandir gelesen; die Prüfung
+    erfolgt über die zwischengespeicherten DirEntry-Informationen statt über
+    einzelne os.path.exists-Aufrufe.
+    
+    Returns:
+        str oder None: Pfad zu config_loader.py, falls gefunden
+    """
+    for config_dir in (os.path.join(PROJECT_ROOT, "config"),
+                       os.path.join(PROJECT_ROOT, "src", "config")):
         try:
-            # Versuche 3: Dynamischer Import
-            config_loader_path = os.path.join(PROJECT_ROOT, "config", "config_loader.py")
-            
-            if not os.path.exists(config_loader_path):
-                config_loader_path = os.path.join(PROJECT_ROOT, "src", "config", "config_loader.py")
-            
-            if os.path.exists(config_loader_path):
-                import importlib.util
-                spec = importlib.util.spec_from_file_location("config_loader", config_loader_path)
-                config_loader_module = importlib.util.module_from_spec(spec)
-                sys.modules["config_loader"] = config_loader_module
-                spec.loader.exec_module(config_loader_module)
-                
-                if hasattr(config_loader_module, "load_config"):
-                    config_loader = config_loader_module.load_config
-                    logging.debug(f"ConfigLoader dynamisch aus {config_loader_path} geladen")
-                else:
-                    raise AttributeError(f"config_loader.py enthält keine load_config-Funktion")
-            else:
-                raise ImportError(f"config_loader.py nicht gefunden unter: {config_loader_path}")
-        except Exception as e3:
-            logging.error(f"Alle Importversuche für ConfigLoader fehlgeschlagen: {str(e1)}, {str(e2)}, {str(e3)}")
+            with os.scandir(config_dir) as entries:
+                for entry in entries:
+                    if entry.name == "config_loader.py" and entry.is_file():
+                        return entry.path
+        except OSError:
+            continue
+    return None
+
+def _fallback_load_config(config_name: str = "main.yaml") -> Dict[str, Any]:
+    """
+    Dummy-Implementierung für load_config, falls kein ConfigLoader importiert werden kann
+    
+    Args:
+        config_name: Name der Konfigurationsdatei (wird ignoriert)
+        
+    Returns:
+        dict: Standardkonfiguration
+    """
+    logging.warning("ConfigLoader ist eine Dummy-Implementierung - bitte korrigieren")
+    return {
+        "system": {
+            "debug": True,
+            "log_level": "INFO",
+            "log_dir": "logs"
+        },
+        "api": {
+            "port": 8000,
+            "host": "0.0.0.0"
+        },
+        "model": {
+            "default": "gpt-3.5-turbo",
+            "max_tokens": 500,
+            "temperature": 0.7,
+            "models_dir": os.path.join(PROJECT_ROOT, "models"),
+            "cache_dir": os.path.join(PROJECT_ROOT, "cache")
+        },
+        "self_learning": {
+            "enabled": True,
+            "learning_rate": 0.01,
+            "memory_size": 1000
+        },
+        "protection": {
+            "enabled": True,
+            "security_level": "high",
+            "threat_detection": True,
+            "max_threat_level": 5,
+            "protection_modules": ["rule_engine", "quantum_security", "anomaly_detection"]
+        }
+    }
+
+@functools.cache
+def _config_loader():
+    """
+    Importiert load_config beim ersten Zugriff einmal pro Prozess
+    
+    Der Import erfolgt nicht mehr beim Laden dieses Moduls, sodass
+    "from protection_module import ProtectionModule" config.config_loader erst
+    bei der ersten Instanziierung ohne eigene Konfiguration nachlädt.
+    
+    Returns:
+        callable: load_config des ConfigLoaders oder die Dummy-Implementierung
+    """
+    try:
+        # Versuche 1+2: config.config_loader bzw. src.config.config_loader (ohne fehlschlagende Imports)
+        config_loader_spec = _find_spec("config.config_loader") or _find_spec("src.config.config_loader")
+        
+        if config_loader_spec is not None:
+            config_loader_module = importlib.import_module(config_loader_spec.name)
+            config_loader_path = config_loader_spec.origin
+        else:
+            # Versuche 3: Dynamischer Import über den Dateipfad
+            config_loader_path = _resolve_config_loader()
             
-            # Definiere eine Dummy-Implementierung für load_config
-            def load_config(config_name: str = "main.yaml") -> Dict[str, Any]:
-                logging.warning("ConfigLoader ist eine Dummy-Implementierung - bitte korrigieren")
-                return {
-                    "system": {
-                        "debug": True,
-                        "log_level": "INFO",
-                        "log_dir": "logs"
-                    },
-                    "api": {
-                        "port": 8000,
-                        "host": "0.0.0.0"
-                    },
-                    "model": {
-                        "default": "gpt-3.5-turbo",
-                        "max_tokens": 500,
-                        "temperature": 0.7,
-                        "models_dir": os.path.join(PROJECT_ROOT, "models"),
-                        "cache_dir": os.path.join(PROJECT_ROOT, "cache")
-                    },
-                    "self_learning": {
-                        "enabled": True,
-                        "learning_rate": 0.01,
-                        "memory_size": 1000
-                    },
-                    "protection": {
-                        "enabled": True,
-                        "security_level": "high",
-                        "threat_detection": True,
-                        "max_threat_level": 5,
-                        "protection_modules": ["rule_engine", "quantum_security", "anomaly_detection"]
-                    }
-                }
+            if config_loader_path is None:
+                raise ImportError(f"config_loader.py nicht gefunden unter: {PROJECT_ROOT}")
             
-            config_loader = load_config
+            spec = importlib.util.spec_from_file_location("config_loader", config_loader_path)
+            config_loader_module = importlib.util.module_from_spec(spec)
+            sys.modules["config_loader"] = config_loader_module
+            spec.loader.exec_module(config_loader_module)
+        
+        if not hasattr(config_loader_module, "load_config"):
+            raise AttributeError(f"config_loader.py enthält keine load_config-Funktion")
+        
+        logger.debug("ConfigLoader aus %s geladen", config_loader_path)
+        return config_loader_module.load_config
+    except Exception as e:
+        logging.error(f"Alle Importversuche für ConfigLoader fehlgeschlagen: {str(e)}")
+        return _fallback_load_config
+
+@functools.cache
+def _load_protection_config(section: str) -> types.MappingProxyType:
+    """
+    Lädt einen Abschnitt der Hauptkonfiguration einmal pro Prozess
+    
+    Mehrere ProtectionModule-Instanzen teilen sich so das Ergebnis, statt die
+    Konfiguration jedes Mal erneut zu lesen. Der ConfigLoader setzt die Konfiguration
+    aus mehreren Dateien und Umgebungsvariablen zusammen; Änderungen daran werden
+    daher nicht automatisch erkannt. Nach einer Änderung muss
+    _load_protection_config.cache_clear() aufgerufen werden.
+    
+    Args:
+        section: Name des Konfigurationsabschnitts (z.B. "protection")
+        
+    Returns:
+        MappingProxyType: Unveränderliche Sicht auf den Abschnitt
+    """
+    main_config = _config_loader()()
+    return types.MappingProxyType(main_config.get(section, {}))
 
 # Initialisiere Logging
 logger = logging.getLogger("mindestentinel.protection")
 logger.setLevel(logging.INFO)
 
+@functools.cache
+def _rule_engine_cls():
+    """
+    Importiert die RuleEngine-Klasse einmal pro Prozess
+    
+    Das Modul wird per find_spec gesucht statt über fehlschlagende Imports; auch ein
+    negatives Ergebnis wird zwischengespeichert, sodass spätere Instanziierungen
+    nicht erneut suchen.
+    
+    Returns:
+        type: Die RuleEngine-Klasse oder None, wenn sie nicht verfügbar ist
+    """
+    spec = _find_spec("core.rule_engine") or _find_spec("rule_engine")
+    if spec is None:
+        logger.error("RuleEngine-Modul nicht gefunden")
+        return None
+    try:
+        return importlib.import_module(spec.name).RuleEngine
+    except Exception as e:
+        logger.error(f"Fehler beim Import der RuleEngine aus {spec.name}: {str(e)}")
+        return None
+
+def _default_rule_engine():
+    """
+    Erstellt eine Standard-RuleEngine (config/rules.yaml)
+    
+    Jedes ProtectionModule ohne eigene RuleEngine erhält eine eigene Instanz, damit
+    Regeländerungen eines Moduls keine anderen Module beeinflussen. Die Klasse wird
+    nur einmal pro Prozess aufgelöst (siehe _rule_engine_cls).
+    
+    Returns:
+        RuleEngine: Neue RuleEngine-Instanz
+    """
+    RuleEngine = _rule_engine_cls()
+    if RuleEngine is None:
+        raise ImportError("RuleEngine nicht verfügbar")
+    rules_path = os.path.join(PROJECT_ROOT, "config", "rules.yaml")
+    rule_engine = RuleEngine(rules_path=rules_path)
+    rule_engine.load_rules()
+    return rule_engine
+
+def __getattr__(name: str):
+    """
+    Lädt config_loader, load_config und RuleEngine erst beim ersten Attributzugriff (PEP 562)
+    
+    Args:
+        name: Name des angeforderten Modulattributs
+        
+    Returns:
+        Das nachgeladene Objekt
+    """
+    if name in ("config_loader", "load_config"):
+        value = _config_loader()
+    elif name == "RuleEngine" and _rule_engine_cls() is not None:
+        value = _rule_engine_cls()
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+# Verdächtige Schlüsselwörter für die Anomalieerkennung (Reihenfolge bestimmt die gemeldete Fundstelle)
+_SUSPICIOUS_KEYWORDS = ("hack", "exploit", "bypass", "admin", "password")
+
+# Kürzere Eingaben können kein Schlüsselwort enthalten
+_MIN_KW_LEN = min(map(len, _SUSPICIOUS_KEYWORDS))
+
+# Zuordnung von Regel-Schweregraden zu Bedrohungsstufen
+_SEVERITY_MAP = types.MappingProxyType({"low": 1, "medium": 3, "high": 5})
+
+@dataclass(slots=True)
+class SecurityResult:
+    """
+    Ergebnis einer einzelnen Sicherheitsprüfung
+    
+    Wird intern zwischen den Prüfschritten weitergereicht und erst an der
+    öffentlichen API mit to_dict() in ein Dictionary umgewandelt.
+    """
+    allowed: bool
+    threat_level: int
+    message: str
+    details: Dict[str, Any] = field(default_factory=dict)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Wandelt das Ergebnis in das Dictionary-Format der öffentlichen API um
+        
+        Returns:
+            dict: Ergebnis mit allowed, threat_level, message und details
+        """
+        return {
+            "allowed": self.allowed,
+            "threat_level": self.threat_level,
+            "message": self.message,
+            "details": self.details
+        }
+
+# Standard-Schutzkonfiguration, falls die Hauptkonfiguration nicht geladen werden kann
+_DEFAULT_PROTECTION_CONFIG = types.MappingProxyType({
+    "enabled": True,
+    "security_level": "medium",
+    "threat_detection": True,
+    "max_threat_level": 5,
+    "protection_modules": ("rule_engine",)
+})
+
+# Anzahl der Lock-Streifen für benutzerbezogene Zustände (Zweierpotenz)
+_LOCK_STRIPES = 16
+
+# Höchstzahl gleichzeitig verfolgter Benutzer-Anfragehistorien
+_MAX_TRACKED_USERS = 10000
+
+# Eigener Zufallsgenerator für die simulierte Quantenprüfung (unabhängig vom globalen RNG, für Tests seedbar)
+_RNG = random.Random()
+
 class ProtectionModule:
     """
     Implementiert den Schutzmechanismus für Mindestentinel
@@ -143,52 +357,59 @@ class ProtectionModule:
         """
         # Lade oder verwende Standardkonfiguration
         if config is None:
+            # Geladene Konfiguration bleibt unveränderlich; Änderungen landen in der
+            # vorderen Ebene der ChainMap, ohne die Basis zu kopieren oder zu verändern
             try:
-                main_config = config_loader()
-                self.config = main_config.get("protection", {})
+                self._base_config = _load_protection_config("protection")
                 logger.debug("Schutz-Konfiguration aus Hauptkonfiguration geladen")
             except Exception as e:
                 logger.error(f"Fehler beim Laden der Schutz-Konfiguration: {str(e)}")
-                self.config = {
-                    "enabled": True,
-                    "security_level": "medium",
-                    "threat_detection": True,
-                    "max_threat_level": 5,
-                    "protection_modules": ["rule_engine"]
-                }
+                self._base_config = _DEFAULT_PROTECTION_CONFIG
+            self.config = collections.ChainMap({}, self._base_config)
         else:
+            self._base_config = None
             self.config = config
         
         # Extrahiere Konfigurationsparameter
         self.enabled = self.config.get("enabled", True)
         self.security_level = self.config.get("security_level", "medium")
+        if isinstance(self.security_level, str):
+            # Internierte Stufe: Vergleiche mit Literalen wie "low" treffen sofort per Identität
+            self.security_level = sys.intern(self.security_level)
         self.threat_detection = self.config.get("threat_detection", True)
         self.max_threat_level = self.config.get("max_threat_level", 5)
         self.protection_modules = self.config.get("protection_modules", ["rule_engine"])
+        # Aktivierte Module einmalig als frozenset für O(1)-Mitgliedschaftstests
+        self._module_set = frozenset(self.protection_modules)
+        self._quantum_sim_delay = float(self.config.get("quantum_simulation_delay_s", 0.0))
         
         # Setze RuleEngine
         self.rule_engine = rule_engine
         
         # Initialisiere interne Datenstrukturen
-        self.threat_history = []
-        self.security_events = []
+        self.threat_history = collections.deque(maxlen=100)
+        # deque.append ist unter dem GIL atomar - security_events benötigt daher keinen eigenen Lock
+        self.security_events = collections.deque(maxlen=100)
         self.protection_active = self.enabled
         self.last_check_time = None
         
+        # Zeitstempel der letzten Anfragen pro Benutzer, geschützt durch gestreifte Locks,
+        # damit parallele Prüfungen verschiedener Benutzer sich nicht gegenseitig blockieren
+        self._user_requests: Dict[Any, collections.deque] = {}
+        self._stripes = [threading.Lock() for _ in range(_LOCK_STRIPES)]
+        self._prune_lock = threading.Lock()
+        
         # Initialisiere die RuleEngine, wenn nicht bereitgestellt
-        if self.rule_engine is None and "rule_engine" in self.protection_modules:
+        if self.rule_engine is None and "rule_engine" in self._module_set:
             try:
-                from core.rule_engine import RuleEngine
-                rules_path = os.path.join(PROJECT_ROOT, "config", "rules.yaml")
-                self.rule_engine = RuleEngine(rules_path=rules_path)
-                self.rule_engine.load_rules()
+                self.rule_engine = _default_rule_engine()
                 logger.info("Interne RuleEngine initialisiert")
             except Exception as e:
                 logger.error(f"Fehler bei der Initialisierung der internen RuleEngine: {str(e)}")
         
         logger.info("ProtectionModule erfolgreich initialisiert")
-        logger.debug(f"Konfiguration: enabled={self.enabled}, security_level={self.security_level}, "
-                    f"threat_detection={self.threat_detection}, max_threat_level={self.max_threat_level}")
+        logger.debug("Konfiguration: enabled=%s, security_level=%s, threat_detection=%s, max_threat_level=%s",
+                     self.enabled, self.security_level, self.threat_detection, self.max_threat_level)
     
     def check_security(self, input_: Any, context: Dict[str, Any] = None) -> Dict[str, Any]:
         """
@@ -213,31 +434,42 @@ class ProtectionModule:
         if context is None:
             context = {}
         
-        logger.debug(f"Führe Sicherheitsprüfung durch für Eingabe: {str(input_)[:50]}{'...' if len(str(input_)) > 50 else ''}")
+        # Eingabe nur einmal in einen String umwandeln und wiederverwenden
+        input_str = input_ if isinstance(input_, str) else str(input_)
+        input_str_len = len(input_str)
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Führe Sicherheitsprüfung durch für Eingabe: %s%s",
+                         input_str[:50], "..." if input_str_len > 50 else "")
+        
+        # Monotone Uhr für Zeitfenster, Wanduhr nur für gemeldete Zeitstempel
+        now = time.monotonic()
         self.last_check_time = time.time()
         
         try:
             # 1. Regelbasierte Überprüfung
             rule_result = self._check_with_rules(input_, context)
             
-            if not rule_result["allowed"]:
-                logger.warning(f"Sicherheitsregel verletzt: {rule_result['message']}")
-                return rule_result
+            if not rule_result.allowed:
+                logger.warning(f"Sicherheitsregel verletzt: {rule_result.message}")
+                return rule_result.to_dict()
             
             # 2. Anomalie-Erkennung
-            anomaly_result = self._detect_anomalies(input_, context)
+            anomaly_result = self._detect_anomalies(input_, context, _s=input_str, _len=input_str_len,
+                                                    _now=now, _wall=self.last_check_time)
             
-            if not anomaly_result["allowed"]:
-                logger.warning(f"Anomalie erkannt: {anomaly_result['message']}")
-                return anomaly_result
+            if not anomaly_result.allowed:
+                logger.warning(f"Anomalie erkannt: {anomaly_result.message}")
+                return anomaly_result.to_dict()
             
             # 3. Quantenbasierte Sicherheitsprüfung (falls aktiviert)
-            if "quantum_security" in self.protection_modules:
+            quantum_enabled = "quantum_security" in self._module_set
+            if quantum_enabled:
                 quantum_result = self._quantum_security_check(input_, context)
                 
-                if not quantum_result["allowed"]:
-                    logger.warning(f"Quantensicherheitsprüfung fehlgeschlagen: {quantum_result['message']}")
-                    return quantum_result
+                if not quantum_result.allowed:
+                    logger.warning(f"Quantensicherheitsprüfung fehlgeschlagen: {quantum_result.message}")
+                    return quantum_result.to_dict()
             
             # Alle Prüfungen bestanden
             result = {
@@ -245,13 +477,13 @@ class ProtectionModule:
                 "threat_level": 0,
                 "message": "Alle Sicherheitsprüfungen bestanden",
                 "details": {
-                    "rule_check": rule_result,
-                    "anomaly_check": anomaly_result
+                    "rule_check": rule_result.to_dict(),
+                    "anomaly_check": anomaly_result.to_dict()
                 }
             }
             
-            if "quantum_security" in self.protection_modules:
-                result["details"]["quantum_check"] = quantum_result
+            if quantum_enabled:
+                result["details"]["quantum_check"] = quantum_result.to_dict()
             
             logger.info("Sicherheitsprüfung erfolgreich bestanden")
             return result
@@ -265,7 +497,7 @@ class ProtectionModule:
                 "details": {}
             }
     
-    def _check_with_rules(self, input_: Any, context: Dict[str, Any]) -> Dict[str, Any]:
+    def _check_with_rules(self, input_: Any, context: Dict[str, Any]) -> SecurityResult:
         """
         Überprüft die Eingabe mit Hilfe der Regel-Engine
         
@@ -274,28 +506,18 @@ class ProtectionModule:
             context: Kontext für die Regelanwendung
             
         Returns:
-            dict: Ergebnis der Regelüberprüfung
+            SecurityResult: Ergebnis der Regelüberprüfung
         """
         if not self.rule_engine:
             logger.warning("RuleEngine nicht verfügbar - überspringe regelbasierte Sicherheitsprüfung")
-            return {
-                "allowed": True,
-                "threat_level": 0,
-                "message": "Regel-Engine nicht verfügbar",
-                "details": {}
-            }
+            return SecurityResult(True, 0, "Regel-Engine nicht verfügbar")
         
         try:
             # Wende Regeln an
             rule_result = self.rule_engine.apply_rules(input_, context=context)
             
             if rule_result["allowed"]:
-                return {
-                    "allowed": True,
-                    "threat_level": 0,
-                    "message": "Regelüberprüfung bestanden",
-                    "details": rule_result
-                }
+                return SecurityResult(True, 0, "Regelüberprüfung bestanden", rule_result)
             else:
                 # Bestimme die Bedrohungsstufe basierend auf der Regel
                 threat_level = 3  # Standardwert
@@ -304,37 +526,37 @@ class ProtectionModule:
                 if "threat_level" in rule_result:
                     threat_level = rule_result["threat_level"]
                 elif "severity" in rule_result:
-                    severity_map = {"low": 1, "medium": 3, "high": 5}
-                    threat_level = severity_map.get(rule_result["severity"], 3)
+                    threat_level = _SEVERITY_MAP.get(rule_result["severity"], 3)
                 
-                return {
-                    "allowed": False,
-                    "threat_level": threat_level,
-                    "message": rule_result["message"],
-                    "details": rule_result
-                }
+                return SecurityResult(False, threat_level, rule_result["message"], rule_result)
                 
         except Exception as e:
             logger.error(f"Fehler bei der regelbasierten Sicherheitsprüfung: {str(e)}")
-            return {
-                "allowed": False,
-                "threat_level": 5,
-                "message": f"Regelüberprüfung fehlgeschlagen: {str(e)}",
-                "details": {}
-            }
+            return SecurityResult(False, 5, f"Regelüberprüfung fehlgeschlagen: {str(e)}")
     
-    def _detect_anomalies(self, input_: Any, context: Dict[str, Any]) -> Dict[str, Any]:
+    def _detect_anomalies(self, input_: Any, context: Dict[str, Any],
+                          _s: Optional[str] = None, _len: Optional[int] = None,
+                          _now: Optional[float] = None, _wall: Optional[float] = None) -> SecurityResult:
         """
         Erkennt Anomalien in der Eingabe
         
         Args:
             input_: Die zu überprüfenden Daten
             context: Kontext für die Anomalieerkennung
+            _s: Bereits berechnete String-Darstellung der Eingabe (intern)
+            _len: Länge von _s (intern)
+            _now: Zeitpunkt der Prüfung laut time.monotonic() (intern)
+            _wall: Zeitpunkt der Prüfung laut time.time() (intern)
             
         Returns:
-            dict: Ergebnis der Anomalieerkennung
+            SecurityResult: Ergebnis der Anomalieerkennung
         """
-        logger.debug("Führe Anomalieerkennung durch...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Führe Anomalieerkennung durch...")
+        
+        input_str = _s if _s is not None else (input_ if isinstance(input_, str) else str(input_))
+        input_str_len = _len if _len is not None else len(input_str)
+        now = _now if _now is not None else time.monotonic()
         
         # Hier würde die eigentliche Anomalieerkennung stattfinden
         # Für dieses Beispiel verwenden wir eine einfache Heuristik
@@ -344,60 +566,116 @@ class ProtectionModule:
         
         # Prüfe auf ungewöhnliche Eingabelänge
         if hasattr(input_, "__len__"):
-            length = len(input_)
+            length = input_str_len if isinstance(input_, str) else len(input_)
             if length > 1000:
                 threat_level = max(threat_level, 2)
                 message = "Ungewöhnlich lange Eingabe erkannt"
         
         # Prüfe auf verdächtige Schlüsselwörter
-        suspicious_keywords = ["hack", "exploit", "bypass", "admin", "password"]
-        if isinstance(input_, str):
-            for keyword in suspicious_keywords:
-                if keyword in input_.lower():
-                    threat_level = max(threat_level, 3)
-                    message = f"Verdächtiges Schlüsselwort erkannt: {keyword}"
-                    break
+        keyword_hits = []
+        if isinstance(input_, str) and input_str_len >= _MIN_KW_LEN:
+            lowered = input_str.lower()
+            keyword_hits = [keyword for keyword in _SUSPICIOUS_KEYWORDS if keyword in lowered]
+            if keyword_hits:
+                threat_level = max(threat_level, 3)
+                message = f"Verdächtiges Schlüsselwort erkannt: {keyword_hits[0]}"
         
         # Prüfe auf häufige Anfragen aus demselben Kontext
+        recent_requests_count = 0
         if "user_id" in context:
             user_id = context["user_id"]
-            recent_requests = [event for event in self.security_events 
-                             if event.get("context", {}).get("user_id") == user_id 
-                             and time.time() - event["timestamp"] < 60]
-            
-            if len(recent_requests) > 10:
+            if not isinstance(user_id, str):
+                try:
+                    hash(user_id)
+                except TypeError:
+                    # Nicht hashbare Kennungen (z.B. Listen) über ihre Darstellung zuordnen
+                    user_id = (type(user_id).__name__, repr(user_id))
+            cutoff = now - 60.0
+            if len(self._user_requests) >= _MAX_TRACKED_USERS and user_id not in self._user_requests:
+                self._prune_user_requests(cutoff)
+            with self._lock_for(user_id):
+                user_requests = self._user_requests.get(user_id)
+                if user_requests is None:
+                    user_requests = self._user_requests[user_id] = collections.deque(maxlen=100)
+                while user_requests and user_requests[0] <= cutoff:
+                    user_requests.popleft()
+                recent_requests_count = len(user_requests)
+                user_requests.append(now)
+            
+            if recent_requests_count > 10:
                 threat_level = max(threat_level, 4)
                 message = "Häufige Anfragen erkannt - mögliche Brute-Force-Attacke"
         
-        result = {
-            "allowed": threat_level < self.max_threat_level,
-            "threat_level": threat_level,
-            "message": message,
-            "details": {
+        result = SecurityResult(
+            threat_level < self.max_threat_level,
+            threat_level,
+            message,
+            {
                 "input_length": len(input_) if hasattr(input_, "__len__") else "N/A",
-                "suspicious_keywords_found": [kw for kw in suspicious_keywords if kw in input_.lower()] if isinstance(input_, str) else [],
-                "recent_requests_count": len(recent_requests) if "recent_requests" in locals() else 0
+                "suspicious_keywords_found": keyword_hits,
+                "recent_requests_count": recent_requests_count
             }
-        }
-        
-        # Speichere das Sicherheitsereignis
-        self.security_events.append({
-            "timestamp": time.time(),
-            "input_data": str(input_)[:100] + "..." if len(str(input_)) > 100 else str(input_),
-            "context": context,
-            "result": result
-        })
-        
-        # Behalte nur die letzten 100 Ereignisse
-        if len(self.security_events) > 100:
-            self.security_events = self.security_events[-100:]
+        )
+        
+        # Speichere das Sicherheitsereignis (bei niedriger Sicherheitsstufe nur auffällige Eingaben)
+        if threat_level > 0 or self.security_level != "low":
+            truncated = input_str if input_str_len <= 100 else input_str[:100] + "..."
+            self.security_events.append({
+                "timestamp": _wall if _wall is not None else time.time(),
+                "monotonic": now,
+                "input_data": truncated,
+                "context": context,
+                "result": result
+            })
         
-        if not result["allowed"]:
+        if not result.allowed:
             logger.warning(f"Anomalie erkannt: {message} (Bedrohungsstufe: {threat_level})")
         
         return result
     
-    def _quantum_security_check(self, input_: Any, context: Dict[str, Any]) -> Dict[str, Any]:
+    def _prune_user_requests(self, cutoff: float) -> None:
+        """
+        Begrenzt die Anzahl der Anfragehistorien
+        
+        Entfernt Benutzer ohne Anfragen im aktuellen Zeitfenster; reicht das nicht,
+        werden die am längsten verfolgten Benutzer verworfen, bis wieder Platz für
+        ein Viertel von _MAX_TRACKED_USERS ist. Läuft bereits eine Bereinigung,
+        kehrt der Aufruf sofort zurück.
+        
+        Args:
+            cutoff: Zeitpunkt (time.monotonic()), vor dem Anfragen nicht mehr zählen
+        """
+        if not self._prune_lock.acquire(blocking=False):
+            return
+        try:
+            for user_id in list(self._user_requests):
+                with self._lock_for(user_id):
+                    user_requests = self._user_requests.get(user_id)
+                    if user_requests is not None and (not user_requests or user_requests[-1] <= cutoff):
+                        del self._user_requests[user_id]
+            
+            excess = len(self._user_requests) - _MAX_TRACKED_USERS * 3 // 4
+            if excess > 0:
+                # Dicts behalten die Einfügereihenfolge: die ältesten Einträge zuerst
+                for user_id in list(itertools.islice(self._user_requests, excess)):
+                    with self._lock_for(user_id):
+                        self._user_requests.pop(user_id, None)
+        finally:
+            self._prune_lock.release()
+    
+    def _lock_for(self, user_id: Any) -> threading.Lock:
+        """
+        Liefert den Lock-Streifen, der die Anfragehistorie eines Benutzers schützt
+        
+        Args:
+            user_id: Benutzerkennung aus dem Kontext
+            
+        Returns:
+            threading.Lock: Lock für den Streifen dieses Benutzers
+        """
+        return self._stripes[hash(user_id) & (_LOCK_STRIPES - 1)]
+    
+    def _quantum_security_check(self, input_: Any, context: Dict[str, Any]) -> SecurityResult:
         """
         Führt eine quantenbasierte Sicherheitsprüfung durch
         
@@ -406,30 +684,31 @@ class ProtectionModule:
             context: Kontext für die Quantensicherheitsprüfung
             
         Returns:
-            dict: Ergebnis der Quantensicherheitsprüfung
+            SecurityResult: Ergebnis der Quantensicherheitsprüfung
         """
-        logger.debug("Führe quantenbasierte Sicherheitsprüfung durch...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Führe quantenbasierte Sicherheitsprüfung durch...")
         
         # Hier würde die eigentliche Quantensicherheitsprüfung stattfinden
         # Für dieses Beispiel verwenden wir einen Dummy
         
-        # Simuliere Quantenberechnung
-        time.sleep(0.1)
+        # Simuliere Quantenberechnung (Verzögerung nur, wenn explizit konfiguriert)
+        if self._quantum_sim_delay:
+            time.sleep(self._quantum_sim_delay)
         
         # Generiere ein zufälliges Ergebnis für das Beispiel
-        import random
-        threat_level = random.randint(0, 2)
+        threat_level = _RNG.randint(0, 2)
         allowed = threat_level < 3
         
-        result = {
-            "allowed": allowed,
-            "threat_level": threat_level,
-            "message": "Quantensicherheitsprüfung abgeschlossen" if allowed else "Quantensicherheitsprüfung fehlgeschlagen",
-            "details": {
-                "quantum_state": "entangled" if random.random() > 0.3 else "collapsed",
-                "probability": random.uniform(0.7, 1.0) if allowed else random.uniform(0.0, 0.3)
+        result = SecurityResult(
+            allowed,
+            threat_level,
+            "Quantensicherheitsprüfung abgeschlossen" if allowed else "Quantensicherheitsprüfung fehlgeschlagen",
+            {
+                "quantum_state": "entangled" if _RNG.random() > 0.3 else "collapsed",
+                "probability": _RNG.uniform(0.7, 1.0) if allowed else _RNG.uniform(0.0, 0.3)
             }
-        }
+        )
         
         if not allowed:
             logger.warning(f"Quantensicherheitsprüfung fehlgeschlagen (Bedrohungsstufe: {threat_level})")
@@ -493,7 +772,7 @@ class ProtectionModule:
         Returns:
             list: Liste der Sicherheitsereignisse
         """
-        return self.threat_history[-limit:]
+        return list(itertools.islice(self.threat_history, max(0, len(self.threat_history) - limit), None))
     
     def get_security_events(self, limit: int = 50) -> List[Dict[str, Any]]:
         """
@@ -505,7 +784,8 @@ class ProtectionModule:
         Returns:
             list: Liste der Sicherheitsereignisse
         """
-        return self.security_events[-limit:]
+        events = itertools.islice(self.security_events, max(0, len(self.security_events) - limit), None)
+        return [{**event, "result": event["result"].to_dict()} for event in events]
     
     def enable_protection(self) -> None:
         """
@@ -570,6 +850,7 @@ class ProtectionModule:
             
             # Sammle Statistiken
             total_threats = len(self.threat_history)
+            # Ein Durchlauf über die (auf 100 Einträge begrenzte) Historie
             threat_levels = [event["threat_level"] for event in self.threat_history]
             avg_threat_level = sum(threat_levels) / total_threats
             high_threats = sum(1 for level in threat_levels if level >= 4)
@@ -590,7 +871,8 @@ class ProtectionModule:
                 "last_analysis": time.time()
             }
             
-            logger.debug(f"Bedrohungsmusteranalyse abgeschlossen: {result}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Bedrohungsmusteranalyse abgeschlossen: %s", result)
             return result
             
         except Exception as e:
@@ -632,23 +914,20 @@ class ProtectionModule:
             logger.warning(f"Gegenmaßnahme durchgeführt: {action} (Timeout: {timeout}s)")
             
             # Speichere die Bedrohung in der Historie
+            timestamp = time.time()
             self.threat_history.append({
-                "timestamp": time.time(),
+                "timestamp": timestamp,
                 "threat_level": threat_level,
                 "action_taken": action,
                 "timeout": timeout
             })
             
-            # Behalte nur die letzten 100 Bedrohungen
-            if len(self.threat_history) > 100:
-                self.threat_history = self.threat_history[-100:]
-            
             return {
                 "status": "success",
                 "action": action,
                 "message": message,
                 "timeout": timeout,
-                "timestamp": time.time()
+                "timestamp": timestamp
             }
             
         except Exception as e:
@@ -7,53 +7,90 @@ QuantumComputing - Wrapper für Qiskit & PennyLane.
 """
 
 from __future__ import annotations
+import functools
 import logging
 from typing import Dict, Any
 
 _LOGGER = logging.getLogger("mindestentinel.quantum")
 
-try:
-    from qiskit import QuantumCircuit, Aer, execute
-    _HAS_QISKIT = True
-except Exception:
-    _HAS_QISKIT = False
+# Optionale Bibliotheken werden erst beim ersten Gebrauch importiert (einmal pro Prozess).
+# Schlägt der Import fehl (nicht installiert, defekt oder inkompatibel, z.B. qiskit >= 1.0
+# ohne Aer/execute), heben die Helfer RuntimeError; auch neural_quantum nutzt sie.
 
-try:
-    import pennylane as qml
-    from pennylane import numpy as np
-    _HAS_PENNYLANE = True
-except Exception:
-    _HAS_PENNYLANE = False
+@functools.cache
+def _qiskit():
+    # (QuantumCircuit, Aer, execute) aus qiskit
+    try:
+        from qiskit import QuantumCircuit, Aer, execute
+    except Exception as e:
+        raise RuntimeError(f"Qiskit nicht verfügbar (pip install qiskit): {e}") from e
+    return QuantumCircuit, Aer, execute
+
+@functools.cache
+def _pennylane():
+    # pennylane-Modul
+    try:
+        import pennylane as qml
+    except Exception as e:
+        raise RuntimeError(f"PennyLane nicht verfügbar (pip install pennylane): {e}") from e
+    return qml
+
+@functools.cache
+def _pennylane_numpy():
+    # pennylane.numpy (differenzierbares numpy)
+    try:
+        from pennylane import numpy as pnp
+    except Exception as e:
+        raise RuntimeError(f"PennyLane nicht verfügbar (pip install pennylane): {e}") from e
+    return pnp
+
+def _bell_circuit():
+    # feste Bell-Pair-Schaltung (H + CNOT, beide Qubits gemessen)
+    QuantumCircuit, _, _ = _qiskit()
+    qc = QuantumCircuit(2, 2)
+    qc.h(0)
+    qc.cx(0,1)
+    qc.measure([0,1],[0,1])
+    return qc
+
+def _expectation_qnode():
+    # QNode für <Z0> nach H + CNOT; wird einmal getract und danach wiederverwendet
+    qml = _pennylane()
+    dev = qml.device("default.qubit", wires=2)
+    @qml.qnode(dev)
+    def circuit():
+        qml.Hadamard(wires=0)
+        qml.CNOT(wires=[0,1])
+        return qml.expval(qml.PauliZ(0))
+    return circuit
 
 class QuantumComputing:
     def __init__(self, provider: str = "qiskit"):
         self.provider = provider
-        if provider == "qiskit" and not _HAS_QISKIT:
-            raise RuntimeError("Qiskit nicht installiert. pip install qiskit")
-        if provider == "pennylane" and not _HAS_PENNYLANE:
-            raise RuntimeError("PennyLane nicht installiert. pip install pennylane")
+        # Backend und Schaltung einmal erzeugen statt bei jedem Lauf; fehlt der
+        # Provider, heben _qiskit()/_pennylane() RuntimeError
+        self._backend = None
+        self._bell_qc = None
+        if provider == "qiskit":
+            _, Aer, _ = _qiskit()
+            self._backend = Aer.get_backend("qasm_simulator")
+            self._bell_qc = _bell_circuit()
+        self._pl_circuit = None
+        if provider == "pennylane":
+            self._pl_circuit = _expectation_qnode()
         _LOGGER.info("QuantumComputing initialized with provider=%s", provider)
 
     def run_bell_pair_qiskit(self) -> Dict[str, int]:
-        if not _HAS_QISKIT:
-            raise RuntimeError("Qiskit nicht verfügbar")
-        backend = Aer.get_backend("qasm_simulator")
-        qc = QuantumCircuit(2, 2)
-        qc.h(0)
-        qc.cx(0,1)
-        qc.measure([0,1],[0,1])
-        job = execute(qc, backend=backend, shots=1024)
+        _, Aer, execute = _qiskit()
+        if self._bell_qc is None:
+            self._backend = Aer.get_backend("qasm_simulator")
+            self._bell_qc = _bell_circuit()
+        job = execute(self._bell_qc, backend=self._backend, shots=1024)
         result = job.result()
         counts = result.get_counts()
         return counts
 
     def pennylane_expectation(self) -> float:
-        if not _HAS_PENNYLANE:
-            raise RuntimeError("PennyLane nicht verfügbar")
-        dev = qml.device("default.qubit", wires=2)
-        @qml.qnode(dev)
-        def circuit():
-            qml.Hadamard(wires=0)
-            qml.CNOT(wires=[0,1])
-            return qml.expval(qml.PauliZ(0))
-        return float(circuit())
+        if self._pl_circuit is None:
+            self._pl_circuit = _expectation_qnode()
+        return float(self._pl_circuit())
@@ -4,43 +4,56 @@ Regel-Engine für Mindestentinel - Verarbeitet Sicherheitsregeln, Zugriffssteuer
 """
 
 import os
+import re
 import sys
 import logging
+import functools
+import importlib
+import importlib.util
+import pathlib
+import types
+import copy
 import yaml
 import hashlib
-from typing import Dict, Any, List, Optional, Tuple
+import heapq
+import collections
+import hmac
+from typing import TYPE_CHECKING, Callable, Dict, Any, List, Mapping, Optional, Tuple, Union
 from datetime import datetime
 
+if TYPE_CHECKING:
+    import numpy as np
+
 # Robuste Projekt-Root-Erkennung
+@functools.cache
 def get_project_root() -> str:
     """
     Findet das Projekt-Root-Verzeichnis unabhängig vom aktuellen Arbeitsverzeichnis
     
+    Das Ergebnis wird pro Prozess zwischengespeichert; die Kandidaten werden der
+    Reihe nach mit je einem is_dir-Aufruf geprüft, der erste Treffer gewinnt.
+    
     Returns:
         str: Absolute Pfad zum Projekt-Root
     """
-    current_file = os.path.abspath(__file__)
-    current_dir = os.path.dirname(current_file)
-    
-    # Versuche 1: Von src/core aus
-    project_root = os.path.dirname(os.path.dirname(current_dir))
-    if os.path.exists(os.path.join(project_root, "core")):
-        return project_root
-    
-    # Versuche 2: Von core aus
-    project_root = os.path.dirname(current_dir)
-    if os.path.exists(os.path.join(project_root, "src", "core")):
-        return project_root
+    current_file = pathlib.Path(os.path.abspath(__file__))
+    parents = current_file.parents
     
-    # Versuche 3: Aktuelles Verzeichnis ist Projekt-Root
-    project_root = current_dir
-    if os.path.exists(os.path.join(project_root, "src", "core")) or os.path.exists(os.path.join(project_root, "core")):
-        return project_root
+    candidates = (
+        # Versuche 1: Von src/core aus
+        (parents[2], ("core",)),
+        # Versuche 2: Von core aus
+        (parents[1], ("src/core",)),
+        # Versuche 3: Aktuelles Verzeichnis ist Projekt-Root
+        (parents[0], ("src/core", "core")),
+    )
+    if len(parents) > 3:
+        # Versuche 4: Projekt-Root ist zwei Ebenen höher
+        candidates += ((parents[3], ("core",)),)
     
-    # Versuche 4: Projekt-Root ist zwei Ebenen höher
-    project_root = os.path.dirname(os.path.dirname(os.path.dirname(current_dir)))
-    if os.path.exists(os.path.join(project_root, "core")):
-        return project_root
+    for project_root, markers in candidates:
+        if any((project_root / marker).is_dir() for marker in markers):
+            return str(project_root)
     
     # Fallback: Aktuelles Verzeichnis
     return os.getcwd()
@@ -50,74 +63,199 @@ PROJECT_ROOT = get_project_root()
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
-# Import-Handling für ConfigLoader
-config_loader = None
-try:
-    # Versuche 1: Import aus config
-    from config.config_loader import load_config
-    config_loader = load_config
-    logging.debug("ConfigLoader erfolgreich aus config.config_loader importiert")
-except ImportError as e1:
+def _find_spec(module_name: str):
+    """
+    Sucht ein Modul, ohne es zu importieren oder bei Fehlschlag eine Exception zu werfen
+    
+    Args:
+        module_name: Vollqualifizierter Modulname
+        
+    Returns:
+        ModuleSpec oder None, wenn das Modul nicht gefunden wurde
+    """
     try:
-        # Versuche 2: Import aus src/config
-        from src.config.config_loader import load_config
-        config_loader = load_config
-        logging.debug("ConfigLoader erfolgreich aus src.config.config_loader importiert")
-    except ImportError as e2:
+        return importlib.util.find_spec(module_name)
+    except (ImportError, ValueError):
+        return None
+
+def _fallback_load_config(config_name: str = "main.yaml") -> Dict[str, Any]:
+    """
+    Dummy-Implementierung für load_config, falls kein ConfigLoader importiert werden kann
+    
+    Args:
+        config_name: Name der Konfigurationsdatei (wird ignoriert)
+        
+    Returns:
+        dict: Standardkonfiguration
+    """
+    logging.warning("ConfigLoader ist eine Dummy-Implementierung - bitte korrigieren")
+    return {
+        "system": {
+            "debug": True,
+            "log_level": "INFO",
+            "log_dir": "logs"
+        },
+        "api": {
+            "port": 8000,
+            "host": "0.0.0.0"
+        },
+        "model": {
+            "default": "gpt-3.5-turbo",
+            "max_tokens": 500
+        },
+        "self_learning": {
+            "enabled": True,
+            "learning_rate": 0.01,
+            "memory_size": 1000
+        }
+    }
+
+@functools.cache
+def _config_loader():
+    """
+    Importiert load_config beim ersten Zugriff einmal pro Prozess
+    
+    Die Kandidaten werden per find_spec geprüft, fehlende Module kosten daher
+    keine ImportError-Exceptions; das Modul selbst importiert den ConfigLoader nicht.
+    
+    Returns:
+        callable: load_config des ConfigLoaders oder die Dummy-Implementierung
+    """
+    errors = []
+    # PROJECT_ROOT liegt bereits in sys.path
+    for module_name in ("config.config_loader", "src.config.config_loader"):
+        if _find_spec(module_name) is None:
+            errors.append(f"{module_name} nicht gefunden")
+            continue
         try:
-            # Versuche 3: Dynamischer Import
-            config_loader_path = os.path.join(PROJECT_ROOT, "config", "config_loader.py")
-            
-            if not os.path.exists(config_loader_path):
-                config_loader_path = os.path.join(PROJECT_ROOT, "src", "config", "config_loader.py")
-            
-            if os.path.exists(config_loader_path):
-                import importlib.util
-                spec = importlib.util.spec_from_file_location("config_loader", config_loader_path)
-                config_loader_module = importlib.util.module_from_spec(spec)
-                sys.modules["config_loader"] = config_loader_module
-                spec.loader.exec_module(config_loader_module)
-                
-                if hasattr(config_loader_module, "load_config"):
-                    config_loader = config_loader_module.load_config
-                    logging.debug(f"ConfigLoader dynamisch aus {config_loader_path} geladen")
-                else:
-                    raise AttributeError(f"config_loader.py enthält keine load_config-Funktion")
-            else:
-                raise ImportError(f"config_loader.py nicht gefunden unter: {config_loader_path}")
-        except Exception as e3:
-            logging.error(f"Alle Importversuche für ConfigLoader fehlgeschlagen: {str(e1)}, {str(e2)}, {str(e3)}")
-            
-            # Definiere eine Dummy-Implementierung für load_config
-            def load_config(config_name: str = "main.yaml") -> Dict[str, Any]:
-                logging.warning("ConfigLoader ist eine Dummy-Implementierung - bitte korrigieren")
-                return {
-                    "system": {
-                        "debug": True,
-                        "log_level": "INFO",
-                        "log_dir": "logs"
-                    },
-                    "api": {
-                        "port": 8000,
-                        "host": "0.0.0.0"
-                    },
-                    "model": {
-                        "default": "gpt-3.5-turbo",
-                        "max_tokens": 500
-                    },
-                    "self_learning": {
-                        "enabled": True,
-                        "learning_rate": 0.01,
-                        "memory_size": 1000
-                    }
-                }
-            
-            config_loader = load_config
+            loader = importlib.import_module(module_name).load_config
+            logging.debug("ConfigLoader erfolgreich aus %s importiert", module_name)
+            return loader
+        except Exception as e:
+            errors.append(str(e))
+    
+    logging.error(f"Alle Importversuche für ConfigLoader fehlgeschlagen: {', '.join(errors)}")
+    return _fallback_load_config
+
+def __getattr__(name: str):
+    """
+    Lädt config_loader und load_config erst beim ersten Attributzugriff (PEP 562)
+    
+    Args:
+        name: Name des angeforderten Modulattributs
+        
+    Returns:
+        Das nachgeladene Objekt
+    """
+    if name in ("config_loader", "load_config"):
+        value = _config_loader()
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
 
 # Initialisiere Logging
 logger = logging.getLogger("mindestentinel.rule_engine")
 logger.setLevel(logging.INFO)
 
+# libyaml-basierte (C-)Loader/Dumper verwenden, falls PyYAML damit gebaut wurde
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Hashverfahren der Regel-Signatur; neue Signaturen tragen das Verfahren als Präfix
+# ("blake2b:<hex>"), Signaturen ohne Präfix sind SHA-256 (bisheriges Format)
+_SIGNATURE_ALGORITHMS = {
+    "blake2b": lambda data: hashlib.blake2b(data, digest_size=32),
+    "sha256": hashlib.sha256,
+}
+_SIGNATURE_ALGORITHM = "blake2b"
+_LEGACY_SIGNATURE_ALGORITHM = "sha256"
+
+# Markiert fehlende Kontextschlüssel (unterscheidbar von None-Werten)
+_MISSING = object()
+
+# Maximale Anzahl zwischengespeicherter apply_rules-Ergebnisse pro RuleEngine
+_RESULT_CACHE_SIZE = 4096
+
+# Längere Eingaben werden nicht zwischengespeichert (begrenzt den Speicher des Caches)
+_RESULT_CACHE_MAX_INPUT = 4096
+
+# Bereits geparste Regeldateien, nur im Prozessspeicher: geprüfter Dateiinhalt -> Regeln
+_PARSED_RULES_CACHE_SIZE = 8
+_parsed_rules = collections.OrderedDict()
+
+# Arten der Prüfschritte vorbereiteter Validierungsregeln
+_LENGTH_STEP = "length"
+_PATTERN_STEP = "pattern"
+
+def _context_conditions(rule: Dict[str, Any]) -> Tuple[Tuple[str, Any], ...]:
+    """
+    Extrahiert die Kontextbedingungen einer Regel als Tupel von (Schlüssel, Wert)
+    
+    Nur Bedingungen als dict beziehen sich auf den Kontext; Listen enthalten
+    Validierungsbedingungen (length, pattern) und schränken die Anwendbarkeit nicht ein.
+    
+    Args:
+        rule: Die Regeldefinition
+        
+    Returns:
+        tuple: Kontextbedingungen (leer, wenn die Regel immer anwendbar ist)
+    """
+    conditions = rule.get("conditions")
+    return tuple(conditions.items()) if isinstance(conditions, dict) else ()
+
+def _intern_conditions(context_conditions: Tuple[Tuple[str, Any], ...]) -> Tuple[Tuple[str, Any], ...]:
+    """
+    Interniert Schlüssel und Textwerte von Kontextbedingungen
+    
+    Gleiche internierte Strings (z.B. Literale im Aufrufer) vergleichen sich dann
+    über die Identität, ohne Zeichen für Zeichen verglichen zu werden.
+    
+    Args:
+        context_conditions: (Schlüssel, Wert)-Paare einer Regel
+        
+    Returns:
+        tuple: Dieselben Paare mit internierten Strings
+    """
+    return tuple(
+        (sys.intern(key) if type(key) is str else key, sys.intern(value) if type(value) is str else value)
+        for key, value in context_conditions
+    )
+
+@functools.cache
+def _numpy():
+    # numpy erst für apply_rules_batch importieren, einmal pro Prozess
+    import numpy
+    return numpy
+
+def _parse_rules(rules_content: bytes) -> List[Dict[str, Any]]:
+    """
+    Parst den (bereits geprüften) Inhalt einer Regeldatei
+    
+    Identische Inhalte werden pro Prozess nur einmal geparst, z.B. beim Neuladen
+    oder für mehrere RuleEngine-Instanzen; jeder Aufrufer erhält eine eigene Kopie.
+    
+    Args:
+        rules_content: Inhalt der Regeldatei
+        
+    Returns:
+        list: Die Regeln aus dem Abschnitt "rules"
+    """
+    rules = _parsed_rules.get(rules_content)
+    if rules is None:
+        # libyaml dekodiert die Bytes selbst
+        rules_data = yaml.load(rules_content, Loader=_YAML_LOADER)
+        rules = rules_data.get('rules', [])
+        _parsed_rules[rules_content] = rules
+        if len(_parsed_rules) > _PARSED_RULES_CACHE_SIZE:
+            _parsed_rules.popitem(last=False)
+    else:
+        try:
+            _parsed_rules.move_to_end(rules_content)
+        except KeyError:
+            pass
+    return copy.deepcopy(rules)
+
 class RuleEngine:
     """
     Regel-Engine für Mindestentinel
@@ -134,8 +272,42 @@ class RuleEngine:
         """
         self.rules_path = rules_path
         self.config = config
+        # Regelversion: wird bei jeder Änderung der Regeln erhöht (Zuweisung an rules,
+        # load_rules, add_rule, remove_rule, invalidate); abgeleitete Daten merken sich
+        # die Version, für die sie aufgebaut wurden
+        self._rules_version = 0
         self.rules = []
         self.signature_path = None
+        # (Pfad, Inode, mtime_ns, Größe, gespeicherte Signatur) der zuletzt geladenen Regeldatei
+        self._cache_key = None
+        # Regeln mit vorab extrahierten Kontextbedingungen: [(rule, conditions)]
+        self._compiled_rules = None
+        self._compiled_version = None
+        # Index über die erste Kontextbedingung: (Schlüssel, Wert) -> Regelindizes,
+        # sowie Indizes der Regeln, die ohne Index geprüft werden müssen
+        self._by_kv = {}
+        self._always_on = []
+        # Tripel für den Index-Weg: bei indizierten Regeln ohne die erste Kontextbedingung
+        self._dispatch_rules = []
+        # Kontextschlüssel, die im Index vorkommen
+        self._index_keys = ()
+        # Vorkompilierte Muster der pattern-Bedingungen: Musterquelle -> re.Pattern
+        self._patterns = {}
+        # Kontextschlüssel, die in Regelbedingungen vorkommen, und LRU-Cache der
+        # apply_rules-Ergebnisse: (Eingabe, Werte dieser Schlüssel) -> Ergebnis
+        self._context_keys = ()
+        self._result_cache = collections.OrderedDict()
+        self._result_cache_version = None
+        # Namensindex: Regelname -> Regeln mit diesem Namen (für get_rule_by_name, remove_rule)
+        self._name_index = None
+        self._name_index_version = None
+        # Regeln werden erst beim ersten Zugriff geladen (siehe _ensure_loaded)
+        self._loaded = False
+        # Regeltyp -> Anwendungsfunktion (für _apply_single_rule)
+        self._rule_handlers = {
+            "validation": self._apply_validation_rule,
+            "transformation": self._apply_transformation_rule,
+        }
         
         # Setze Standard-Regelpfad, wenn keiner angegeben wurde
         if not self.rules_path:
@@ -146,6 +318,19 @@ class RuleEngine:
         
         logger.debug(f"RuleEngine initialisiert mit Regelpfad: {self.rules_path}")
         logger.debug(f"Signaturpfad: {self.signature_path}")
+    
+    def _ensure_loaded(self) -> None:
+        """
+        Lädt die Regeln beim ersten Zugriff
+        
+        Instanzen, die nie Regeln anwenden (Tests, Health-Checks), sparen so das
+        Lesen, Prüfen und Parsen der Regeldatei. Direkt gesetzte Regeln bleiben erhalten.
+        """
+        if self._loaded:
+            return
+        self._loaded = True
+        if self.rules:
+            return
         
         # Lade Regeln, wenn der Pfad existiert
         if os.path.exists(self.rules_path):
@@ -153,47 +338,101 @@ class RuleEngine:
         else:
             logger.warning(f"Regeldatei nicht gefunden unter: {self.rules_path}")
     
-    def calculate_signature(self, rules_content: str) -> str:
+    @property
+    def rules(self) -> List[Dict[str, Any]]:
+        """
+        Die geladenen Regeln
+        
+        Werden die Liste oder einzelne Regeln direkt verändert, muss danach
+        invalidate() (oder reload_rules) aufgerufen werden.
+        """
+        return self._rules
+    
+    @rules.setter
+    def rules(self, rules: List[Dict[str, Any]]) -> None:
+        self._rules = rules
+        self._rules_version += 1
+    
+    def invalidate(self) -> None:
+        """
+        Verwirft vorbereitete Regeln, Indizes und zwischengespeicherte Ergebnisse
+        
+        Nötig nach direkten Änderungen an self.rules oder an einzelnen Regeln;
+        add_rule, remove_rule, load_rules und Zuweisungen an rules tun das selbst.
+        """
+        self._rules_version += 1
+    
+    def calculate_signature(self, rules_content: Union[str, bytes], algorithm: str = _SIGNATURE_ALGORITHM) -> str:
         """
         Berechnet die Signatur für die Regeln
         
         Args:
-            rules_content: Inhalt der Regeldatei
+            rules_content: Inhalt der Regeldatei (bytes werden ohne Umkodierung gehasht)
+            algorithm: Hashverfahren (standardmäßig BLAKE2b)
             
         Returns:
-            str: SHA-256-Hash der Regeln
+            str: Hash der Regeln als "<verfahren>:<hex>"; für SHA-256 nur "<hex>" (bisheriges Format)
+            
+        Raises:
+            ValueError: Wenn das Hashverfahren nicht unterstützt wird
         """
-        return hashlib.sha256(rules_content.encode()).hexdigest()
+        hash_factory = _SIGNATURE_ALGORITHMS.get(algorithm)
+        if hash_factory is None:
+            raise ValueError(f"Nicht unterstütztes Signaturverfahren: {algorithm}")
+        if isinstance(rules_content, str):
+            rules_content = rules_content.encode()
+        digest = hash_factory(rules_content).hexdigest()
+        if algorithm == _LEGACY_SIGNATURE_ALGORITHM:
+            return digest
+        return f"{algorithm}:{digest}"
     
-    def verify_signature(self) -> bool:
+    def verify_signature(self, rules_content: Optional[bytes] = None, stored_signature: Optional[str] = None) -> bool:
         """
         Überprüft die Signatur der Regeldatei
         
+        Args:
+            rules_content: Bereits gelesener Dateiinhalt (wird sonst von der Platte gelesen)
+            stored_signature: Bereits gelesene gespeicherte Signatur (wird sonst von der Platte gelesen)
+            
         Returns:
             bool: True, wenn die Signatur gültig ist, sonst False
         """
-        if not os.path.exists(self.rules_path):
+        # Existenzprüfungen nur für Daten, die noch gelesen werden müssen
+        if rules_content is None and not os.path.exists(self.rules_path):
             logger.error(f"Regeldatei nicht gefunden: {self.rules_path}")
             return False
         
-        if not os.path.exists(self.signature_path):
+        if stored_signature is None and not os.path.exists(self.signature_path):
             logger.warning(f"Signaturdatei nicht gefunden: {self.signature_path}")
             return False
         
         try:
-            # Lese Regeln
-            with open(self.rules_path, 'r') as f:
-                rules_content = f.read()
+            # Lese Regeln binär (ohne Dekodierung in einen str)
+            if rules_content is None:
+                with open(self.rules_path, 'rb') as f:
+                    rules_content = f.read()
             
-            # Berechne aktuelle Signatur
-            current_signature = self.calculate_signature(rules_content)
+            # Zeilenenden wie beim Lesen im Textmodus vereinheitlichen, damit
+            # bestehende Signaturen gültig bleiben
+            if b"\r" in rules_content:
+                rules_content = rules_content.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
             
             # Lese gespeicherte Signatur
-            with open(self.signature_path, 'r') as f:
-                stored_signature = f.read().strip()
+            if stored_signature is None:
+                with open(self.signature_path, 'r') as f:
+                    stored_signature = f.read().strip()
+            
+            # Berechne aktuelle Signatur mit dem Verfahren der gespeicherten Signatur
+            algorithm, separator, _ = stored_signature.partition(":")
+            if not separator:
+                algorithm = _LEGACY_SIGNATURE_ALGORITHM
+            elif algorithm not in _SIGNATURE_ALGORITHMS:
+                logger.error(f"Nicht unterstütztes Signaturverfahren: {algorithm}")
+                return False
+            current_signature = self.calculate_signature(rules_content, algorithm)
             
-            # Vergleiche Signaturen
-            is_valid = current_signature == stored_signature
+            # Vergleiche Signaturen (zeitkonstant)
+            is_valid = hmac.compare_digest(current_signature, stored_signature)
             
             if is_valid:
                 logger.debug("Regel-Signatur ist gültig")
@@ -206,6 +445,27 @@ class RuleEngine:
             logger.error(f"Fehler bei der Signaturüberprüfung: {str(e)}")
             return False
     
+    def _rules_cache_key(self, st: Optional[os.stat_result] = None) -> Optional[Tuple[str, int, int, int, str]]:
+        """
+        Ermittelt den Cache-Schlüssel der Regeldatei ohne sie zu lesen
+        
+        Args:
+            st: Bereits ermittelter os.stat-Eintrag der Regeldatei
+            
+        Returns:
+            tuple: (Pfad, Inode, mtime_ns, Größe, gespeicherte Signatur) oder None, wenn
+            Regel- oder Signaturdatei nicht lesbar sind
+        """
+        try:
+            if st is None:
+                st = os.stat(self.rules_path)
+            with open(self.signature_path, 'r') as f:
+                stored_signature = f.read().strip()
+        except OSError:
+            return None
+        # Inode erkennt auch per Umbenennen ersetzte Dateien mit gleicher mtime und Größe
+        return (self.rules_path, st.st_ino, st.st_mtime_ns, st.st_size, stored_signature)
+    
     def load_rules(self) -> Dict[str, Any]:
         """
         Lädt die Regeln aus der Regeldatei
@@ -218,26 +478,45 @@ class RuleEngine:
             ValueError: Wenn die Signatur ungültig ist
         """
         logger.info(f"Lade Regeln aus: {self.rules_path}")
+        self._loaded = True
         
-        # Überprüfe, ob die Regeldatei existiert
-        if not os.path.exists(self.rules_path):
+        # Überprüfe, ob die Regeldatei existiert (ein stat für Existenz und Cache-Schlüssel)
+        try:
+            st = os.stat(self.rules_path)
+        except OSError:
             logger.error(f"Regeldatei nicht gefunden: {self.rules_path}")
             self.rules = []
+            self._cache_key = None
             return {"status": "error", "message": f"Regeldatei nicht gefunden: {self.rules_path}"}
         
-        # Überprüfe die Signatur
-        if not self.verify_signature():
+        # Unveränderte Datei: bereits geladene und geprüfte Regeln weiterverwenden
+        cache_key = self._rules_cache_key(st)
+        stored_signature = cache_key[-1] if cache_key is not None else None
+        if cache_key is not None and cache_key == self._cache_key and self.rules:
+            logger.debug("Regeldatei unverändert - verwende geladene Regeln")
+            return {"status": "success", "rules_loaded": len(self.rules), "cached": True}
+        self._cache_key = None
+        
+        # Lese die Regeldatei einmal binär für Signaturprüfung und Parser
+        try:
+            with open(self.rules_path, 'rb') as f:
+                rules_content = f.read()
+        except OSError as e:
+            logger.error(f"Fehler beim Lesen der Regeldatei: {str(e)}")
+            self.rules = []
+            return {"status": "error", "message": str(e)}
+        
+        # Überprüfe die Signatur (gespeicherte Signatur ist bereits gelesen)
+        if not self.verify_signature(rules_content, stored_signature):
             logger.error("Regel-Signatur ungültig")
             self.rules = []
             return {"status": "error", "message": "Regel-Signatur ungültig"}
         
         try:
-            # Lade die Regeln
-            with open(self.rules_path, 'r') as f:
-                rules_data = yaml.safe_load(f)
-            
-            # Extrahiere die eigentlichen Regeln
-            self.rules = rules_data.get('rules', [])
+            # Lade die Regeln (unveränderte Inhalte ohne erneutes Parsen)
+            self.rules = _parse_rules(rules_content)
+            self._cache_key = cache_key
+            self._current_compiled_rules()
             
             logger.info(f"{len(self.rules)} Regeln erfolgreich geladen")
             return {"status": "success", "rules_loaded": len(self.rules)}
@@ -247,6 +526,193 @@ class RuleEngine:
             self.rules = []
             return {"status": "error", "message": str(e)}
     
+    def _compile_rules(self) -> List[Tuple[Dict[str, Any], Tuple[Tuple[str, Any], ...], Optional[Callable[[Any], Mapping[str, Any]]]]]:
+        """
+        Bereitet alle Regeln einmalig für apply_rules vor
+        
+        Extrahiert die Kontextbedingungen, kompiliert die Muster und erzeugt für
+        Validierungsregeln eine spezialisierte Prüffunktion.
+        
+        Returns:
+            list: Tripel aus Regel, Kontextbedingungen und Prüffunktion (oder None)
+        """
+        # Muster aller pattern-Bedingungen einmalig kompilieren
+        self._patterns = {}
+        for rule in self.rules:
+            conditions = rule.get("conditions")
+            if not isinstance(conditions, list):
+                continue
+            for condition in conditions:
+                if isinstance(condition, dict) and condition.get("type") == "pattern":
+                    pattern = condition.get("pattern")
+                    if isinstance(pattern, str) and pattern not in self._patterns:
+                        try:
+                            self._patterns[pattern] = re.compile(pattern)
+                        except re.error as e:
+                            logger.error(f"Ungültiges Muster in Regel '{rule.get('name', 'Unbenannte Regel')}': {str(e)}")
+        
+        self._compiled_rules = [
+            (rule, _intern_conditions(_context_conditions(rule)), self._build_validator(rule)) for rule in self.rules
+        ]
+        self._compiled_version = self._rules_version
+        
+        # Nur diese Kontextschlüssel beeinflussen das Ergebnis; neue Regeln machen
+        # zwischengespeicherte Ergebnisse ungültig
+        self._context_keys = tuple(dict.fromkeys(
+            key for _, context_conditions, _ in self._compiled_rules for key, _ in context_conditions
+        ))
+        self._result_cache.clear()
+        
+        # Regeln nach ihrer ersten Kontextbedingung einsortieren (Indizes aufsteigend)
+        # Indizierte Regeln erhalten ein Tripel ohne die erste Kontextbedingung, da der
+        # Index-Treffer sie bereits erfüllt; einfache Kontextregeln brauchen so keine Prüfung mehr
+        self._by_kv = {}
+        self._always_on = []
+        self._dispatch_rules = list(self._compiled_rules)
+        for index, (rule, context_conditions, validator) in enumerate(self._compiled_rules):
+            if context_conditions:
+                try:
+                    self._by_kv.setdefault(context_conditions[0], []).append(index)
+                    self._dispatch_rules[index] = (rule, context_conditions[1:], validator)
+                    continue
+                except TypeError:
+                    # Nicht hashbarer Bedingungswert - Regel immer prüfen
+                    pass
+            self._always_on.append(index)
+        self._index_keys = tuple(dict.fromkeys(key for key, _ in self._by_kv))
+        
+        return self._compiled_rules
+    
+    def _build_validator(self, rule: Dict[str, Any]) -> Optional[Callable[[Any], Mapping[str, Any]]]:
+        """
+        Erzeugt eine auf die Regel spezialisierte Prüffunktion
+        
+        Die Bedingungen werden einmalig in ein Tupel von Prüfschritten mit festen
+        Grenzwerten, kompilierten Mustern und fertigen Meldungen übersetzt; pro Aufruf
+        entfallen damit die dict-Zugriffe und Typvergleiche von _apply_validation_rule.
+        
+        Args:
+            rule: Die Regeldefinition
+            
+        Returns:
+            callable: Prüffunktion mit gleichem Ergebnis wie _apply_validation_rule,
+            oder None, wenn die Regel über den allgemeinen Weg geprüft werden muss
+        """
+        conditions = rule.get("conditions", {})
+        if rule.get("type", "validation") != "validation" or not isinstance(conditions, list):
+            return None
+        
+        rule_message = rule.get("message", "Eingabe verletzt Regel")
+        steps = []
+        for condition in conditions:
+            if not isinstance(condition, dict):
+                return None
+            condition_type = condition.get("type")
+            
+            if condition_type == "length":
+                min_length = condition.get("min")
+                max_length = condition.get("max")
+                steps.append((
+                    _LENGTH_STEP, min_length, max_length,
+                    f"{rule_message} (Zu kurz: min={min_length})",
+                    f"{rule_message} (Zu lang: max={max_length})"
+                ))
+            
+            elif condition_type == "pattern":
+                pattern = condition.get("pattern")
+                if pattern is None:
+                    continue
+                regex = self._patterns.get(pattern) if isinstance(pattern, str) else None
+                if regex is None:
+                    return None
+                steps.append((_PATTERN_STEP, regex, None, f"{rule_message} (Muster nicht erfüllt: {pattern})", None))
+        
+        steps = tuple(steps)
+        # Erfolgsergebnis einmal pro Regel; apply_rules liest davon nur "allowed",
+        # daher genügt eine unveränderliche, geteilte Instanz
+        ok_result = types.MappingProxyType({
+            "allowed": True,
+            "message": f"Regel '{rule.get('name', 'Unbenannte Regel')}' erfüllt"
+        })
+        
+        def validate(input_data: Any) -> Dict[str, Any]:
+            try:
+                data_len = len(input_data)
+            except TypeError:
+                data_len = None
+            is_text = isinstance(input_data, str)
+            
+            for kind, first, second, message, second_message in steps:
+                if kind is _LENGTH_STEP:
+                    if data_len is not None:
+                        if first is not None and data_len < first:
+                            return {"allowed": False, "message": message}
+                        if second is not None and data_len > second:
+                            return {"allowed": False, "message": second_message}
+                elif is_text and first.search(input_data) is None:
+                    return {"allowed": False, "message": message}
+            
+            return ok_result
+        
+        # Prüfschritte für apply_rules_batch zugänglich machen
+        validate.steps = steps
+        return validate
+    
+    def _current_compiled_rules(self) -> List[Tuple[Dict[str, Any], Tuple[Tuple[str, Any], ...], Optional[Callable[[Any], Mapping[str, Any]]]]]:
+        """
+        Liefert die vorbereiteten Regeln und bereitet sie neu vor, wenn sich die
+        Regelversion seit der Vorbereitung geändert hat
+        
+        Returns:
+            list: Tripel aus Regel, Kontextbedingungen und Prüffunktion
+        """
+        compiled = self._compiled_rules
+        if compiled is None or self._compiled_version != self._rules_version:
+            compiled = self._compile_rules()
+        return compiled
+    
+    def _candidate_rules(self, context: Dict[str, Any]) -> List[Tuple[Dict[str, Any], Tuple[Tuple[str, Any], ...], Optional[Callable[[Any], Mapping[str, Any]]]]]:
+        """
+        Liefert die Regeln, die für den Kontext in Frage kommen, in Originalreihenfolge
+        
+        Über den Index werden nur Regeln berücksichtigt, deren erste Kontextbedingung
+        im Kontext erfüllt ist; geliefert werden nur noch die übrigen Bedingungen,
+        die apply_rules prüft. Der Aufrufer gleicht Regeln und Index vorher über
+        _current_compiled_rules mit der aktuellen Regelversion ab.
+        
+        Args:
+            context: Der aktuelle Kontext
+            
+        Returns:
+            list: Tripel aus Regel, Kontextbedingungen und Prüffunktion
+        """
+        compiled = self._compiled_rules
+        
+        if not self._by_kv:
+            return compiled
+        
+        # Nur Schlüssel nachschlagen, die Kontext und Index gemeinsam haben; über die
+        # kleinere Seite iterieren (große Kontexte mit vielen fremden Schlüsseln)
+        index_keys = self._index_keys
+        if len(context) <= len(index_keys):
+            items = context.items()
+        else:
+            items = [(key, context[key]) for key in index_keys if key in context]
+        
+        buckets = [self._always_on]
+        for key, value in items:
+            try:
+                bucket = self._by_kv.get((key, value))
+            except TypeError:
+                continue
+            if bucket:
+                buckets.append(bucket)
+        
+        # Jede Regel liegt in genau einem Bucket; merge erhält die Regelreihenfolge
+        indices = buckets[0] if len(buckets) == 1 else heapq.merge(*buckets)
+        dispatch = self._dispatch_rules
+        return [dispatch[index] for index in indices]
+    
     def reload_rules(self) -> Dict[str, Any]:
         """
         Lädt die Regeln neu
@@ -270,29 +736,102 @@ class RuleEngine:
         if context is None:
             context = {}
         
-        logger.debug(f"Wende {len(self.rules)} Regeln auf Eingabe an")
+        self._ensure_loaded()
+        # Lazy formatiert: pro Aufruf keine Stringbildung, solange DEBUG aus ist
+        logger.debug("Wende %d Regeln auf Eingabe an", len(self.rules))
         
         # Wenn keine Regeln geladen sind, erlaube alles
         if not self.rules:
             logger.warning("Keine Regeln geladen - erlaube alle Eingaben")
             return {"allowed": True, "message": "Keine Regeln geladen"}
         
-        # Durchlaufe alle Regeln
-        for rule in self.rules:
+        # Wiederholte Eingaben: Ergebnis aus dem Cache statt alle Regeln erneut zu prüfen
+        self._current_compiled_rules()
+        cache_key = self._result_cache_key(input_data, context)
+        if cache_key is None:
+            return self._evaluate_rules(input_data, context)
+        
+        # Nach jeder Regeländerung (neue Regelversion) neu beginnen
+        cache = self._result_cache
+        version = self._rules_version
+        if self._result_cache_version != version:
+            cache.clear()
+            self._result_cache_version = version
+        cached = cache.get(cache_key)
+        if cached is not None:
+            try:
+                cache.move_to_end(cache_key)
+            except KeyError:
+                pass
+            if not cached["allowed"] and logger.isEnabledFor(logging.WARNING):
+                logger.warning("Regel verletzt (zwischengespeichert): %s", cached["message"])
+            return dict(cached)
+        
+        result = self._evaluate_rules(input_data, context)
+        cache[cache_key] = result
+        if len(cache) > _RESULT_CACHE_SIZE:
+            cache.popitem(last=False)
+        # Kopie zurückgeben, damit Änderungen des Aufrufers den Cache nicht verfälschen
+        return dict(result)
+    
+    def _result_cache_key(self, input_data: Any, context: Dict[str, Any]) -> Optional[Tuple[Any, ...]]:
+        """
+        Bildet den Cache-Schlüssel für apply_rules
+        
+        Args:
+            input_data: Die zu überprüfenden Daten
+            context: Der aktuelle Kontext
+            
+        Returns:
+            tuple: (Eingabe, Werte der relevanten Kontextschlüssel) oder None, wenn das
+            Ergebnis nicht zwischengespeichert werden kann (keine oder zu lange Texteingabe,
+            nicht hashbare Werte)
+        """
+        if type(input_data) is not str or len(input_data) > _RESULT_CACHE_MAX_INPUT:
+            return None
+        key = (input_data, tuple(context.get(name, _MISSING) for name in self._context_keys))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+    
+    def _evaluate_rules(self, input_data: Any, context: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Prüft die Eingabe gegen alle für den Kontext in Frage kommenden Regeln
+        
+        Args:
+            input_data: Die zu überprüfenden Daten
+            context: Der aktuelle Kontext
+            
+        Returns:
+            dict: Ergebnis der Regelanwendung mit allowed-Flag und Nachricht
+        """
+        # Methoden einmal binden statt pro Regel nachzuschlagen
+        matches_context = self._matches_context
+        apply_single_rule = self._apply_single_rule
+        
+        # Durchlaufe alle für den Kontext in Frage kommenden Regeln
+        for rule, context_conditions, validator in self._candidate_rules(context):
             try:
                 # Überprüfe, ob die Regel auf diesen Kontext anwendbar ist
-                if not self._is_rule_applicable(rule, context):
+                if context_conditions and not matches_context(context_conditions, context):
                     continue
                 
-                # Wende die Regel an
-                result = self._apply_single_rule(rule, input_data, context)
+                # Wende die Regel an (vorbereitete Prüffunktion, falls vorhanden)
+                if validator is not None:
+                    result = validator(input_data)
+                else:
+                    result = apply_single_rule(rule, input_data, context)
                 
                 if not result["allowed"]:
-                    logger.warning(f"Regel verletzt: {rule.get('name', 'Unbenannte Regel')} - {result['message']}")
+                    if logger.isEnabledFor(logging.WARNING):
+                        logger.warning("Regel verletzt: %s - %s", rule.get('name', 'Unbenannte Regel'), result['message'])
                     return result
             
             except Exception as e:
-                logger.error(f"Fehler bei der Anwendung der Regel '{rule.get('name', 'Unbenannte Regel')}': {str(e)}")
+                if logger.isEnabledFor(logging.ERROR):
+                    logger.error("Fehler bei der Anwendung der Regel '%s': %s", rule.get('name', 'Unbenannte Regel'), e)
                 # Bei Regel-Fehlern erlauben wir die Eingabe nicht
                 return {
                     "allowed": False,
@@ -302,6 +841,83 @@ class RuleEngine:
         # Alle Regeln wurden erfolgreich angewendet
         return {"allowed": True, "message": "Alle Regeln erfüllt"}
     
+    def apply_rules_batch(self, inputs: List[Any], context: Dict[str, Any] = None) -> "np.ndarray":
+        """
+        Wendet die Regeln auf viele Eingaben gleichzeitig an
+        
+        Jede Regel wird einmal für den ganzen Stapel ausgewertet; Längenbedingungen
+        werden als Vergleich über ein Array aller Eingabelängen geprüft. Das Ergebnis
+        entspricht pro Eingabe dem allowed-Flag von apply_rules.
+        
+        Args:
+            inputs: Die zu überprüfenden Daten
+            context: Optionaler Kontext für die Regelanwendung (für alle Eingaben gleich)
+            
+        Returns:
+            np.ndarray: bool-Maske, True für erlaubte Eingaben
+        """
+        if context is None:
+            context = {}
+        
+        self._ensure_loaded()
+        np = _numpy()
+        inputs = list(inputs)
+        allowed = np.ones(len(inputs), dtype=bool)
+        if not self.rules or not inputs:
+            return allowed
+        
+        logger.debug("Wende %d Regeln auf %d Eingaben an", len(self.rules), len(inputs))
+        
+        # Längen einmal bestimmen; -1 für Eingaben ohne Länge (Längenprüfung entfällt)
+        lengths = np.fromiter(
+            (len(item) if hasattr(item, "__len__") else -1 for item in inputs),
+            dtype=np.int64, count=len(inputs)
+        )
+        has_length = lengths >= 0
+        text_indices = [index for index, item in enumerate(inputs) if isinstance(item, str)]
+        
+        self._current_compiled_rules()
+        for rule, context_conditions, validator in self._candidate_rules(context):
+            if context_conditions and not self._matches_context(context_conditions, context):
+                continue
+            
+            steps = getattr(validator, "steps", None)
+            batched = False
+            if steps is not None:
+                try:
+                    for kind, first, second, _, _ in steps:
+                        if kind is _LENGTH_STEP:
+                            if first is not None:
+                                allowed &= ~(has_length & (lengths < first))
+                            if second is not None:
+                                allowed &= ~(has_length & (lengths > second))
+                        else:
+                            for index in text_indices:
+                                if allowed[index] and first.search(inputs[index]) is None:
+                                    allowed[index] = False
+                    batched = True
+                except Exception as e:
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Stapelprüfung für Regel '%s' nicht möglich: %s", rule.get('name', 'Unbenannte Regel'), e)
+            
+            # Allgemeiner Weg: Regel einzeln auf alle noch erlaubten Eingaben anwenden
+            for index in ([] if batched else np.flatnonzero(allowed)):
+                try:
+                    if validator is not None:
+                        result = validator(inputs[index])
+                    else:
+                        result = self._apply_single_rule(rule, inputs[index], context)
+                    allowed[index] = bool(result["allowed"])
+                except Exception as e:
+                    if logger.isEnabledFor(logging.ERROR):
+                        logger.error("Fehler bei der Anwendung der Regel '%s': %s", rule.get('name', 'Unbenannte Regel'), e)
+                    allowed[index] = False
+            
+            if not allowed.any():
+                break
+        
+        return allowed
+    
     def _is_rule_applicable(self, rule: Dict[str, Any], context: Dict[str, Any]) -> bool:
         """
         Überprüft, ob eine Regel auf den gegebenen Kontext anwendbar ist
@@ -313,22 +929,24 @@ class RuleEngine:
         Returns:
             bool: True, wenn die Regel anwendbar ist, sonst False
         """
-        # Wenn keine Bedingungen definiert sind, ist die Regel immer anwendbar
-        if "conditions" not in rule:
-            return True
-        
-        conditions = rule["conditions"]
+        return self._matches_context(_context_conditions(rule), context)
+    
+    @staticmethod
+    def _matches_context(context_conditions: Tuple[Tuple[str, Any], ...], context: Dict[str, Any]) -> bool:
+        """
+        Prüft vorab extrahierte Kontextbedingungen gegen den Kontext
         
-        # Überprüfe alle Bedingungen
-        for condition_key, condition_value in conditions.items():
-            # Überprüfe, ob der Schlüssel im Kontext existiert
-            if condition_key not in context:
-                return False
+        Args:
+            context_conditions: (Schlüssel, Wert)-Paare der Regel
+            context: Der aktuelle Kontext
             
-            # Überprüfe, ob der Wert übereinstimmt
-            if context[condition_key] != condition_value:
+        Returns:
+            bool: True, wenn alle Schlüssel vorhanden sind und die Werte übereinstimmen
+        """
+        # Ein Lookup pro Schlüssel; fehlende Schlüssel liefern _MISSING
+        for condition_key, condition_value in context_conditions:
+            if context.get(condition_key, _MISSING) != condition_value:
                 return False
-        
         return True
     
     def _apply_single_rule(self, rule: Dict[str, Any], input_data: Any, context: Dict[str, Any]) -> Dict[str, Any]:
@@ -343,16 +961,19 @@ class RuleEngine:
         Returns:
             dict: Ergebnis der Regel mit allowed-Flag und Nachricht
         """
-        # Überprüfe den Regeltyp
+        # Überprüfe den Regeltyp (ein Lookup statt Vergleichskette)
         rule_type = rule.get("type", "validation")
         
-        if rule_type == "validation":
-            return self._apply_validation_rule(rule, input_data, context)
-        elif rule_type == "transformation":
-            return self._apply_transformation_rule(rule, input_data, context)
-        else:
-            logger.warning(f"Unbekannter Regeltyp: {rule_type}")
-            return {"allowed": True, "message": f"Unbekannter Regeltyp: {rule_type}"}
+        try:
+            handler = self._rule_handlers.get(rule_type)
+        except TypeError:
+            # Nicht hashbarer Regeltyp
+            handler = None
+        if handler is not None:
+            return handler(rule, input_data, context)
+        
+        logger.warning(f"Unbekannter Regeltyp: {rule_type}")
+        return {"allowed": True, "message": f"Unbekannter Regeltyp: {rule_type}"}
     
     def _apply_validation_rule(self, rule: Dict[str, Any], input_data: Any, context: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -371,6 +992,12 @@ class RuleEngine:
         rule_message = rule.get("message", "Eingabe verletzt Regel")
         conditions = rule.get("conditions", {})
         
+        # Länge einmal bestimmen statt pro Bedingung (None, wenn die Eingabe keine Länge hat)
+        try:
+            data_len = len(input_data)
+        except TypeError:
+            data_len = None
+        
         # Überprüfe alle Bedingungen
         for condition in conditions:
             condition_type = condition.get("type")
@@ -380,16 +1007,24 @@ class RuleEngine:
                 max_length = condition.get("max")
                 
                 # Überprüfe Länge
-                if hasattr(input_data, "__len__"):
-                    if min_length is not None and len(input_data) < min_length:
+                if data_len is not None:
+                    if min_length is not None and data_len < min_length:
                         return {"allowed": False, "message": f"{rule_message} (Zu kurz: min={min_length})"}
-                    if max_length is not None and len(input_data) > max_length:
+                    if max_length is not None and data_len > max_length:
                         return {"allowed": False, "message": f"{rule_message} (Zu lang: max={max_length})"}
             
             elif condition_type == "pattern":
                 pattern = condition.get("pattern")
-                # Hier würde eine Musterüberprüfung stattfinden
-                # (Für dieses Beispiel überspringen wir die Implementierung)
+                
+                # Überprüfe Muster (Texteingaben müssen das Muster enthalten)
+                if pattern is not None and isinstance(input_data, str):
+                    regex = self._patterns.get(pattern)
+                    if regex is None:
+                        # Nicht vorkompiliert (z.B. nachträglich geänderte Regel); ungültige
+                        # Muster lösen eine Exception aus und führen in apply_rules zur Ablehnung
+                        regex = self._patterns[pattern] = re.compile(pattern)
+                    if regex.search(input_data) is None:
+                        return {"allowed": False, "message": f"{rule_message} (Muster nicht erfüllt: {pattern})"}
         
         # Alle Bedingungen erfüllt
         return {"allowed": True, "message": f"Regel '{rule_name}' erfüllt"}
@@ -414,10 +1049,47 @@ class RuleEngine:
         """
         Gibt die geladenen Regeln zurück
         
+        Geliefert wird eine Kopie; Änderungen daran wirken sich nicht auf die Engine
+        aus (dafür add_rule/remove_rule verwenden).
+        
         Returns:
             list: Liste der Regeln
         """
-        return self.rules
+        self._ensure_loaded()
+        return copy.deepcopy(self.rules)
+    
+    def get_rule_by_name(self, rule_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Gibt eine Regel anhand ihres Namens zurück (über den Namensindex)
+        
+        Args:
+            rule_name: Name der gesuchten Regel
+            
+        Returns:
+            dict: Die erste Regel mit diesem Namen oder None, wenn keine existiert
+        """
+        self._ensure_loaded()
+        matches = self._rules_by_name().get(rule_name)
+        return matches[0] if matches else None
+    
+    def _rules_by_name(self) -> Dict[Any, List[Dict[str, Any]]]:
+        """
+        Liefert den Namensindex der Regeln
+        
+        Der Index wird neu aufgebaut, wenn sich die Regelversion seit dem Aufbau
+        geändert hat (z.B. durch load_rules, add_rule oder invalidate).
+        
+        Returns:
+            dict: Regelname -> Regeln mit diesem Namen (in Regelreihenfolge)
+        """
+        version = self._rules_version
+        if self._name_index is None or self._name_index_version != version:
+            index = {}
+            for rule in self.rules:
+                index.setdefault(rule.get('name'), []).append(rule)
+            self._name_index = index
+            self._name_index_version = version
+        return self._name_index
     
     def add_rule(self, rule: Dict[str, Any]) -> None:
         """
@@ -426,7 +1098,16 @@ class RuleEngine:
         Args:
             rule: Die neue Regel
         """
+        self._ensure_loaded()
+        version = self._rules_version
         self.rules.append(rule)
+        self._cache_key = None
+        self._rules_version += 1
+        
+        # Gültigen Namensindex fortschreiben statt ihn später neu aufzubauen
+        if self._name_index is not None and self._name_index_version == version:
+            self._name_index.setdefault(rule.get('name'), []).append(rule)
+            self._name_index_version = self._rules_version
         logger.info(f"Neue Regel hinzugefügt: {rule.get('name', 'Unbenannte Regel')}")
     
     def remove_rule(self, rule_name: str) -> bool:
@@ -439,9 +1120,17 @@ class RuleEngine:
         Returns:
             bool: True, wenn die Regel entfernt wurde, sonst False
         """
-        initial_count = len(self.rules)
-        self.rules = [rule for rule in self.rules if rule.get('name') != rule_name]
-        removed = len(self.rules) < initial_count
+        self._ensure_loaded()
+        # Nachschlagen über den Namensindex; unbekannte Namen kosten keinen Listendurchlauf
+        matches = self._rules_by_name().pop(rule_name, None)
+        removed = bool(matches)
+        if removed:
+            # In-place entfernen: die Liste bleibt dasselbe Objekt
+            removed_ids = {id(rule) for rule in matches}
+            self.rules[:] = [rule for rule in self.rules if id(rule) not in removed_ids]
+            self._rules_version += 1
+            self._name_index_version = self._rules_version
+            self._cache_key = None
         
         if removed:
             logger.info(f"Regel entfernt: {rule_name}")
@@ -461,6 +1150,8 @@ class RuleEngine:
             dict: Ergebnis des Speichervorgangs
         """
         save_path = path or self.rules_path
+        # Ungeladene Regeln nicht mit einer leeren Liste überschreiben
+        self._ensure_loaded()
         
         try:
             # Bereite Daten für das Speichern vor
@@ -470,17 +1161,24 @@ class RuleEngine:
                 "rules": self.rules
             }
             
+            # Serialisiere einmal direkt als UTF-8-Bytes und hashe denselben Puffer,
+            # statt die Datei erneut zu lesen
+            rules_content = yaml.dump(rules_data, Dumper=_YAML_DUMPER, default_flow_style=False, encoding="utf-8")
+            
             # Speichere die Regeln
-            with open(save_path, 'w') as f:
-                yaml.dump(rules_data, f, default_flow_style=False)
+            with open(save_path, 'wb') as f:
+                f.write(rules_content)
             
             # Berechne und speichere die Signatur
-            with open(save_path, 'r') as f:
-                rules_content = f.read()
-            
             signature = self.calculate_signature(rules_content)
             with open(self.signature_path, 'w') as f:
                 f.write(signature)
+            # Die Datei entspricht jetzt den Regeln im Speicher: Cache-Schlüssel direkt
+            # übernehmen, damit is_valid/load_rules die eben berechnete Signatur nicht erneut prüfen
+            if os.path.abspath(save_path) == os.path.abspath(self.rules_path):
+                self._cache_key = self._rules_cache_key()
+            else:
+                self._cache_key = None
             
             logger.info(f"Regeln erfolgreich gespeichert unter: {save_path}")
             return {"status": "success", "path": save_path}
@@ -496,7 +1194,13 @@ class RuleEngine:
         Returns:
             bool: True, wenn Regeln geladen sind und gültig sind
         """
-        return bool(self.rules) and self.verify_signature()
+        self._ensure_loaded()
+        if not self.rules:
+            return False
+        # Unveränderte, beim Laden bereits geprüfte Datei muss nicht erneut gehasht werden
+        if self._cache_key is not None and self._rules_cache_key() == self._cache_key:
+            return True
+        return self.verify_signature()
 
 # Testblock für direkte Ausführung (nur für Tests)
 if __name__ == "__main__":
@@ -528,7 +1232,7 @@ if __name__ == "__main__":
         # Speichere Test-Regeln
         os.makedirs(os.path.dirname(test_rules_path), exist_ok=True)
         with open(test_rules_path, 'w') as f:
-            yaml.dump(test_rules, f)
+            yaml.dump(test_rules, f, Dumper=_YAML_DUMPER)
         
         # Berechne und speichere Signatur
         with open(test_rules_path, 'r') as f:
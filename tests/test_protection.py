@@ -1,11 +1,70 @@
 # test_protection.py
+import unittest
+from unittest import mock
+
+import src.core.protection_module as protection_module
 from core.protection_module import ProtectionModule
+from src.core.rule_engine import RuleEngine
+
+RULES = [
+    {"name": "laenge", "type": "validation", "message": "Laenge",
+     "conditions": [{"type": "length", "min": 3, "max": 20}]},
+    {"name": "muster", "type": "validation", "message": "Muster",
+     "conditions": [{"type": "pattern", "pattern": "^[^;|&]*$"}]},
+]
+
+
+class TestProtectionModule(unittest.TestCase):
+    def test_default_module_checks_input(self):
+        pm = ProtectionModule()  # erwartet, dass RuleEngine importierbar ist
+        try:
+            self.assertTrue(pm.validate_user_input("ping external_api", {"user": "test"}))
+        except PermissionError:
+            pass
+
+    def test_validate_user_inputs_matches_single_checks(self):
+        engine = RuleEngine("/nicht/vorhanden/rules.yaml")
+        engine.rules = [dict(rule) for rule in RULES]
+        pm = ProtectionModule(engine)
+        inputs = ["ok-eingabe", "ab", "x" * 30, "a; rm -rf /", "noch ok"]
+        expected = []
+        for user_input in inputs:
+            try:
+                expected.append(pm.validate_user_input(user_input))
+            except PermissionError:
+                expected.append(False)
+        self.assertEqual(pm.validate_user_inputs(inputs), expected)
+        with self.assertRaises(TypeError):
+            pm.validate_user_inputs(["ok", 42])
+
+
+class TestUserRequestTracking(unittest.TestCase):
+    def setUp(self):
+        self.pm = protection_module.ProtectionModule(
+            config={"protection_modules": ["anomaly_detection"], "security_level": "medium"}
+        )
+
+    def test_unhashable_user_id_is_tracked(self):
+        result = self.pm.check_security("hallo", {"user_id": ["liste"]})
+        self.assertTrue(result["allowed"], result["message"])
+        for _ in range(11):
+            result = self.pm._detect_anomalies("hallo", {"user_id": ["liste"]})
+        self.assertEqual(result.threat_level, 4)
+
+    def test_expired_user_windows_are_pruned(self):
+        with mock.patch.object(protection_module, "_MAX_TRACKED_USERS", 8):
+            for index in range(8):
+                self.pm._detect_anomalies("hallo", {"user_id": f"u{index}"}, _now=0.0)
+            self.pm._detect_anomalies("hallo", {"user_id": "neu"}, _now=100.0)
+        self.assertEqual(list(self.pm._user_requests), ["neu"])
+
+    def test_tracked_users_stay_bounded(self):
+        with mock.patch.object(protection_module, "_MAX_TRACKED_USERS", 8):
+            for index in range(50):
+                self.pm._detect_anomalies("hallo", {"user_id": f"u{index}"}, _now=1.0)
+            self.assertLessEqual(len(self.pm._user_requests), 8)
+        self.assertIn("u49", self.pm._user_requests)
+
 
-pm = ProtectionModule()  # erwartet, dass RuleEngine importierbar ist
-try:
-    pm.validate_user_input("ping external_api", {"user": "test"})
-    print("Eingabe erlaubt")
-except PermissionError as e:
-    print("Eingabe verboten:", e)
-except Exception as e:
-    print("Fehler bei Prüfung:", e)
+if __name__ == "__main__":
+    unittest.main()
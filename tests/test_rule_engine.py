@@ -1 +1,130 @@
-# test placeholders 
+# tests/test_rule_engine.py
+import hashlib
+import os
+import shutil
+import tempfile
+import unittest
+
+import yaml
+
+from src.core.rule_engine import RuleEngine
+
+RULES = [
+    {"name": "laenge", "type": "validation", "message": "Laenge",
+     "conditions": [{"type": "length", "min": 3, "max": 20}]},
+    {"name": "muster", "type": "validation", "message": "Muster",
+     "conditions": [{"type": "pattern", "pattern": "^[^;|&]*$"}]},
+    {"name": "gast", "type": "validation", "message": "Gast",
+     "conditions": {"user_role": "guest"}},
+]
+
+
+class RuleEngineTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.rules_path = os.path.join(self.tmpdir, "rules.yaml")
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+
+    def write_rules(self, rules, signature=None):
+        # Regeldatei schreiben und (standardmäßig) passend signieren
+        with open(self.rules_path, "w", encoding="utf-8") as f:
+            yaml.safe_dump({"rules": rules}, f)
+        if signature is None:
+            with open(self.rules_path, "rb") as f:
+                signature = RuleEngine(self.rules_path).calculate_signature(f.read())
+        with open(os.path.join(self.tmpdir, "rules.sig"), "w") as f:
+            f.write(signature)
+
+    def engine(self, rules=RULES):
+        engine = RuleEngine(self.rules_path)
+        engine.rules = [dict(rule) for rule in rules]
+        return engine
+
+
+class TestSignatures(RuleEngineTestCase):
+    def test_blake2b_is_default(self):
+        self.write_rules(RULES)
+        with open(os.path.join(self.tmpdir, "rules.sig")) as f:
+            self.assertTrue(f.read().startswith("blake2b:"))
+        engine = RuleEngine(self.rules_path)
+        self.assertTrue(engine.is_valid())
+        self.assertEqual(len(engine.get_rules()), len(RULES))
+
+    def test_legacy_sha256_signature_is_accepted(self):
+        self.write_rules(RULES, signature="0")
+        with open(self.rules_path, "rb") as f:
+            legacy = hashlib.sha256(f.read()).hexdigest()
+        self.write_rules(RULES, signature=legacy)
+        self.assertTrue(RuleEngine(self.rules_path).is_valid())
+
+    def test_unknown_prefix_is_rejected(self):
+        self.write_rules(RULES, signature="md5:" + "0" * 32)
+        engine = RuleEngine(self.rules_path)
+        self.assertFalse(engine.verify_signature())
+        self.assertEqual(engine.get_rules(), [])
+
+    def test_tampered_rules_are_rejected(self):
+        self.write_rules(RULES)
+        with open(self.rules_path, "a", encoding="utf-8") as f:
+            f.write("# geaendert\n")
+        self.assertEqual(RuleEngine(self.rules_path).load_rules()["status"], "error")
+
+
+class TestApplyRules(RuleEngineTestCase):
+    def test_batch_matches_single_results(self):
+        engine = self.engine()
+        inputs = ["ok-eingabe", "ab", "x" * 30, "a; rm -rf /", "", "noch ok"]
+        for context in ({}, {"user_role": "guest"}, {"user_role": "admin"}):
+            expected = [engine.apply_rules(item, context)["allowed"] for item in inputs]
+            self.assertEqual(engine.apply_rules_batch(inputs, context).tolist(), expected)
+
+    def test_list_conditions_apply_regardless_of_context(self):
+        engine = self.engine(RULES[:1])
+        self.assertTrue(engine.apply_rules("passt", {"user_role": "admin"})["allowed"])
+        self.assertFalse(engine.apply_rules("ab", {"user_role": "admin"})["allowed"])
+        self.assertTrue(engine.apply_rules("passt")["allowed"])
+
+    def test_context_conditions_select_rules(self):
+        engine = self.engine()
+        self.assertTrue(engine.apply_rules("hallo", {"user_role": "admin"})["allowed"])
+        self.assertFalse(engine.apply_rules("hallo", {"user_role": "guest"})["allowed"])
+
+
+class TestResultCacheInvalidation(RuleEngineTestCase):
+    def test_add_rule_invalidates(self):
+        engine = self.engine(RULES[:1])
+        self.assertTrue(engine.apply_rules("abcdef")["allowed"])
+        engine.add_rule({"name": "kurz", "type": "validation",
+                         "conditions": [{"type": "length", "max": 4}]})
+        self.assertFalse(engine.apply_rules("abcdef")["allowed"])
+
+    def test_remove_rule_invalidates(self):
+        engine = self.engine(RULES[:1])
+        self.assertFalse(engine.apply_rules("ab")["allowed"])
+        self.assertTrue(engine.remove_rule("laenge"))
+        self.assertTrue(engine.apply_rules("ab")["allowed"])
+
+    def test_load_rules_invalidates(self):
+        self.write_rules(RULES[:1])
+        engine = RuleEngine(self.rules_path)
+        self.assertTrue(engine.apply_rules("abcdef")["allowed"])
+        self.write_rules([{"name": "kurz", "type": "validation",
+                           "conditions": [{"type": "length", "max": 4}]}])
+        self.assertEqual(engine.load_rules()["status"], "success")
+        self.assertFalse(engine.apply_rules("abcdef")["allowed"])
+
+    def test_invalidate_after_in_place_edit(self):
+        engine = self.engine(RULES[:1])
+        self.assertTrue(engine.apply_rules("abcdef")["allowed"])
+        engine.rules[0]["conditions"] = [{"type": "length", "min": 100}]
+        engine.invalidate()
+        self.assertFalse(engine.apply_rules("abcdef")["allowed"])
+
+    def test_get_rules_returns_copy(self):
+        engine = self.engine(RULES[:1])
+        engine.get_rules()[0]["conditions"] = [{"type": "length", "min": 100}]
+        self.assertTrue(engine.apply_rules("abcdef")["allowed"])
+
+
+if __name__ == "__main__":
+    unittest.main()